@@ -27,6 +27,10 @@ class LiveThreatGraph:
         self.max_points = 60
         self.max_value = 100
         
+        # Fonts and the static title are created once, not every frame
+        self.value_font = pygame.font.Font(None, 20)
+        self.title_surf = pygame.font.Font(None, 18).render("THREAT LEVEL", True, (0, 255, 150))
+        
         print("[GRAPH] ✅ Live Graph initialized")
     
     def add_point(self, value: float):
@@ -44,9 +48,7 @@ class LiveThreatGraph:
         pygame.draw.rect(surface, (15, 25, 40), self.rect, border_radius=5)
         pygame.draw.rect(surface, (0, 255, 150), self.rect, 2, border_radius=5)
         
-        font = pygame.font.Font(None, 18)
-        title = font.render("THREAT LEVEL", True, (0, 255, 150))
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 5))
+        surface.blit(self.title_surf, (self.rect.x + 5, self.rect.y + 5))
         
         graph_rect = pygame.Rect(
             self.rect.x + 10,
@@ -80,8 +82,7 @@ class LiveThreatGraph:
         
         if self.data_points:
             value = int(self.data_points[-1]['value'])
-            value_font = pygame.font.Font(None, 20)
-            value_text = value_font.render(f"{value}%", True, (255, 255, 255))
+            value_text = self.value_font.render(f"{value}%", True, (255, 255, 255))
             surface.blit(value_text, (self.rect.right - 35, self.rect.y + 5))
 
 
@@ -92,6 +93,10 @@ class LiveThreatGraph:
 class Boss:
     """A boss enemy with special attacks."""
     
+    # Glow ring textures per (color, alpha, surface size, center, radius) -
+    # the pulse only ever produces a few dozen distinct sizes per boss
+    _glow_cache = {}
+    
     def __init__(self, boss_type: str, wave: int):
         self.boss_type = boss_type
         self.wave = wave
@@ -116,6 +121,7 @@ class Boss:
         
         self.data = self.boss_data.get(boss_type, self.boss_data['DDOS_LORD'])
         self.pulse = 0
+        self.name_surf = pygame.font.Font(None, 20).render(self.data['name'], True, (255, 255, 255))
     
     def update(self):
         """Update boss state."""
@@ -158,8 +164,14 @@ class Boss:
         for i in range(3):
             glow_size = pulse_size + i * 8
             glow_alpha = 100 - i * 30
-            glow_surface = pygame.Surface((int(glow_size * 2.5), int(glow_size * 2.5)), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*color, glow_alpha), (int(glow_size * 1.25), int(glow_size * 1.25)), int(glow_size))
+            dim = int(glow_size * 2.5)
+            center = int(glow_size * 1.25)
+            radius = int(glow_size)
+            key = (color, glow_alpha, dim, center, radius)
+            glow_surface = Boss._glow_cache.get(key)
+            if glow_surface is None:
+                glow_surface = Boss._glow_cache[key] = pygame.Surface((dim, dim), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (*color, glow_alpha), (center, center), radius)
             surface.blit(glow_surface, (self.x - glow_size * 1.25, self.y - glow_size * 1.25))
         
         pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(size))
@@ -185,8 +197,7 @@ class Boss:
         pygame.draw.rect(surface, health_color, (bar_x, bar_y, health_width, bar_height))
         pygame.draw.rect(surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
         
-        font = pygame.font.Font(None, 20)
-        name = font.render(self.data['name'], True, (255, 255, 255))
+        name = self.name_surf
         name_rect = name.get_rect(center=(self.x, bar_y - 12))
         surface.blit(name, name_rect)
 
@@ -281,6 +292,7 @@ class PowerUp:
         
         self.data = self.power_data.get(power_type, self.power_data['shield'])
         self.size = 20
+        self.icon_surf = pygame.font.Font(None, 24).render(self.data['icon'], True, (255, 255, 255))
     
     def update(self):
         """Update power-up."""
@@ -310,8 +322,7 @@ class PowerUp:
         pygame.draw.circle(surface, color, (int(self.x), int(draw_y)), self.size)
         pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(draw_y)), self.size, 2)
         
-        font = pygame.font.Font(None, 24)
-        icon = font.render(self.data['icon'], True, (255, 255, 255))
+        icon = self.icon_surf
         icon_rect = icon.get_rect(center=(self.x, draw_y))
         surface.blit(icon, icon_rect)
     
@@ -329,6 +340,7 @@ class PowerUpSystem:
         self.active_effects = {}
         self.spawn_timer = 0
         self.spawn_interval = 600
+        self.now = time.monotonic() # Clock read once per update(), reused until the next
         
         self.on_powerup_collect = None
         
@@ -350,10 +362,11 @@ class PowerUpSystem:
         
         self.power_ups = [p for p in self.power_ups if p.update()]
         
-        current_time = time.time()
-        expired = [k for k, v in self.active_effects.items() if current_time > v]
-        for k in expired:
-            del self.active_effects[k]
+        current_time = self.now = time.monotonic()
+        if self.active_effects:
+            expired = [k for k, v in self.active_effects.items() if current_time > v]
+            for k in expired:
+                del self.active_effects[k]
     
     def check_collection(self, point) -> PowerUp:
         """Check if point collects a power-up."""
@@ -363,7 +376,7 @@ class PowerUpSystem:
                 
                 duration = power_up.data['duration'] / 60
                 if duration > 0:
-                    self.active_effects[power_up.power_type] = time.time() + duration
+                    self.active_effects[power_up.power_type] = self.now + duration
                 
                 if self.on_powerup_collect:
                     self.on_powerup_collect(power_up)
@@ -393,6 +406,7 @@ class PowerUpSystem:
 
 if __name__ == "__main__":
     print("\nTesting Advanced Features...")
+    pygame.init() # Widgets create their fonts up front
     
     print("\n[TEST] Live Graph")
     graph = LiveThreatGraph(0, 0, 200, 100)
@@ -32,6 +32,10 @@ SIMULATION_MODE = True
 # Debug mode - enables verbose console output
 DEBUG_MODE = True
 
+# Random (uuid4-based) packet IDs for forensic logs that get merged across runs.
+# Off: cheap per-run sequential IDs (no OS entropy read per packet)
+STRICT_PACKET_IDS = False
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           NETWORK INTERFACE SETTINGS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -56,6 +60,30 @@ MAX_QUEUE_SIZE = 500
 # Timeout for queue operations (seconds)
 QUEUE_TIMEOUT = 0.05
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#                           CAPTURE RING SETTINGS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Linux AF_PACKET TPACKET_V3 receive ring used for real capture when available
+# (falls back to Scapy sniff() on other platforms or if the ring can't be set up)
+USE_RX_RING = True
+
+# Size of one ring block in bytes (must be a multiple of the page size)
+RING_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+# Number of blocks in the ring
+RING_BLOCK_COUNT = 16
+
+# Milliseconds before the kernel hands over a partially filled block
+RING_BLOCK_TIMEOUT_MS = 60
+
+# Kernel-side capture filter: only IPv4 always reaches the game. With this on,
+# only packets from IPs in the whitelist/blacklist/suspicious lists do too.
+CAPTURE_LISTED_SOURCES_ONLY = False
+
+# Frames dissected per batch when capturing through Scapy (no ring)
+SCAPY_BATCH_SIZE = 64
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           PACKET RATE SETTINGS
 # ═══════════════════════════════════════════════════════════════════════════════
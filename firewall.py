@@ -34,6 +34,19 @@ logging.basicConfig(
 )
 
 
+def random_source_ip():
+    """Random a.b.c.d with a, d in 1-255 and b, c in 0-255, from a single RNG draw."""
+    n = random.randrange(255 * 256 * 256 * 255)
+    n, d = divmod(n, 255); n, c = divmod(n, 256); a, b = divmod(n, 256)
+    return f"{a+1}.{b}.{c}.{d+1}"
+
+
+def _random_hash():
+    """Abbreviated hash like 'deadbeef...1f2e', from a single RNG draw."""
+    n = random.getrandbits(48)
+    return f"{n >> 16:08x}...{n & 0xFFFF:04x}"
+
+
 # ─────────────────────────────────────────────
 #  ATTACK DATABASE
 # ─────────────────────────────────────────────
@@ -280,6 +293,28 @@ class AttackDatabase:
         i = cls.ATTACKS.get(aid)
         return i["countered_by"] if i else []
 
+    # Random fill for each terminal_log placeholder ({ip} is passed in)
+    _LOG_FILLERS = {
+        "{port}": lambda: str(random.choice([22, 80, 443, 3306, 21, 8080, 23, 53])),
+        "{status}": lambda: random.choice(["OPEN", "FILTERED", "CLOSED"]),
+        "{service}": lambda: random.choice(["OpenSSH 7.9", "Apache 2.4", "MySQL 5.7", "vsftpd 3.0"]),
+        "{domain}": lambda: random.choice(["google.com", "bank.com", "login.secure.net"]),
+        "{fake_ip}": random_source_ip,
+        "{rate}": lambda: str(random.randint(500, 5000)),
+        "{bw}": lambda: str(random.randint(50, 500)),
+        "{cpu}": lambda: str(random.randint(70, 99)),
+        "{ram}": lambda: str(random.randint(75, 99)),
+        "{user}": lambda: random.choice(["root", "admin", "user", "oracle", "postgres"]),
+        "{pwd}": lambda: random.choice(["admin123", "password", "12345", "qwerty", "letmein"]),
+        "{count}": lambda: str(random.randint(100, 9999)),
+        "{pct}": lambda: str(random.randint(70, 99)),
+        "{size}": lambda: str(random.randint(64, 65535)),
+        "{malware_name}": lambda: random.choice(["Trojan.GenericKD", "Ransomware.WannaCry", "Rootkit.Hidden", "Worm.Conficker"]),
+        "{hash}": _random_hash,
+    }
+    # Template -> the (placeholder, fill) pairs it uses, scanned once per template
+    _LOG_PLANS = {}
+    
     @classmethod
     def get_terminal_log(cls, aid, ip="0.0.0.0"):
         i = cls.ATTACKS.get(aid)
@@ -289,28 +324,16 @@ class AttackDatabase:
         if not templates:
             return ""
         template = random.choice(templates)
-        replacements = {
-            "{ip}": ip,
-            "{port}": str(random.choice([22, 80, 443, 3306, 21, 8080, 23, 53])),
-            "{status}": random.choice(["OPEN", "FILTERED", "CLOSED"]),
-            "{service}": random.choice(["OpenSSH 7.9", "Apache 2.4", "MySQL 5.7", "vsftpd 3.0"]),
-            "{domain}": random.choice(["google.com", "bank.com", "login.secure.net"]),
-            "{fake_ip}": f"{random.randint(1,255)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,255)}",
-            "{rate}": str(random.randint(500, 5000)),
-            "{bw}": str(random.randint(50, 500)),
-            "{cpu}": str(random.randint(70, 99)),
-            "{ram}": str(random.randint(75, 99)),
-            "{user}": random.choice(["root", "admin", "user", "oracle", "postgres"]),
-            "{pwd}": random.choice(["admin123", "password", "12345", "qwerty", "letmein"]),
-            "{count}": str(random.randint(100, 9999)),
-            "{pct}": str(random.randint(70, 99)),
-            "{size}": str(random.randint(64, 65535)),
-            "{malware_name}": random.choice(["Trojan.GenericKD", "Ransomware.WannaCry", "Rootkit.Hidden", "Worm.Conficker"]),
-            "{hash}": f"{random.randint(0,0xFFFFFFFF):08x}...{random.randint(0,0xFFFF):04x}",
-        }
-        for k, v in replacements.items():
-            template = template.replace(k, v)
-        return template
+        # Only draw random values for the placeholders this line actually uses
+        fills = cls._LOG_PLANS.get(template)
+        if fills is None:
+            fills = cls._LOG_PLANS[template] = tuple(
+                (k, fill) for k, fill in cls._LOG_FILLERS.items() if k in template
+            )
+        line = template.replace("{ip}", ip)
+        for k, fill in fills:
+            line = line.replace(k, fill())
+        return line
 
 
 # ─────────────────────────────────────────────
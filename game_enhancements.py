@@ -76,7 +76,7 @@ class WaveSystem:
         self.current_wave += 1
         self.wave_active = True
         self.in_break = False
-        self.wave_start_time = time.time()
+        self.wave_start_time = time.monotonic()
         
         if self.on_wave_start:
             self.on_wave_start(self.current_wave, self.get_current_config())
@@ -86,7 +86,7 @@ class WaveSystem:
         
         self.wave_active = False
         self.in_break = True
-        self.break_start_time = time.time()
+        self.break_start_time = time.monotonic()
         
         if self.on_break_start and self.current_wave > 0:
             self.on_break_start(self.current_wave)
@@ -108,7 +108,7 @@ class WaveSystem:
         Returns current wave status.
         """
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if self.in_break:
             elapsed = current_time - self.break_start_time
@@ -201,7 +201,7 @@ class ScoreSystem:
         self.max_combo = 0
         self.combo_timer = 0
         self.combo_timeout = 2.0  # seconds to maintain combo
-        self.last_action_time = 0
+        self.last_action_time = float('-inf')  # Monotonic clock time of the last block
         
         # Multiplier
         self.multiplier = 1.0
@@ -232,7 +232,7 @@ class ScoreSystem:
     def add_block_score(self, packet_type: str):
         """Add score for blocking a packet."""
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Determine base points
         if packet_type == 'malicious':
@@ -318,7 +318,7 @@ class ScoreSystem:
     def update(self):
         """Update score system each frame."""
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Check combo timeout
         if self.combo > 0 and current_time - self.last_action_time > self.combo_timeout:
@@ -148,8 +148,7 @@ class GameLogger:
         """Creates log folder if it doesn't exist."""
         
         try:
-            if not os.path.exists(self.log_folder):
-                os.makedirs(self.log_folder)
+            os.makedirs(self.log_folder, exist_ok=True)
         except Exception as e:
             print(f"[LOGGER] ⚠️ Could not create folder: {e}")
     
@@ -375,11 +374,10 @@ class GameLogger:
         
         logs = []
         
+        # One directory scan; a missing folder just means no logs yet
         try:
-            if os.path.exists(self.log_folder):
-                for file in os.listdir(self.log_folder):
-                    if file.endswith('.log'):
-                        logs.append(file)
+            with os.scandir(self.log_folder) as entries:
+                logs = [e.name for e in entries if e.name.endswith('.log') and e.is_file()]
         except Exception:
             pass
         
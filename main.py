@@ -29,7 +29,7 @@ from sprites import (
 )
 
 # Import Firewall Logic
-from firewall import DefenseEngine, AttackDatabase
+from firewall import DefenseEngine, AttackDatabase, random_source_ip
 
 # Import UI Components
 from ui_components import (
@@ -121,6 +121,26 @@ class PacketDefender:
         self.ui_control = ControlPanel(10, 10, 240, SCREEN_HEIGHT - 20, self.set_auto_defense, self.toggle_encyclopedia, self.toggle_firewall_panel)
         self.ui_actions = ActionButtonGroup(SCREEN_WIDTH//2 - 110, SCREEN_HEIGHT - 210, 225, 40, self.manual_block, self.clear_all_packets, self.heal_server)
         self.score_font = pygame.font.Font(None, 42)
+        self.overlay_font = pygame.font.Font(None, 72)
+        self.overlay_sub_font = pygame.font.Font(None, 32)
+        self.overlay_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA); self.overlay_bg.fill((0, 0, 0, 180))
+        self._text_cache = {} # (font, text, color) -> (surface, centered x)
+        
+        # Static background (fill + grid) rendered once
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)); self.background.fill((10, 15, 25))
+        for x in range(0, SCREEN_WIDTH, 40): pygame.draw.line(self.background, (20, 25, 35), (x, 0), (x, SCREEN_HEIGHT))
+        for y in range(0, SCREEN_HEIGHT, 40): pygame.draw.line(self.background, (20, 25, 35), (0, y), (SCREEN_WIDTH, y))
+        
+        # Regions that can change during normal play; everything else is only pushed on a full flip
+        self._live_rects = [
+            # Play field, HUD, terminal, action buttons and the control panel
+            # column: packets spawn at x=0 and fly across it, and the panel's
+            # labels change with hover and with the defense mode (A key / toggle)
+            pygame.Rect(0, 0, 960, SCREEN_HEIGHT),
+            self.ui_stats.rect, self.ui_toggle.rect, self.ui_log.rect,
+            self.ui_defense_bar.rect.inflate(0, 30), # Includes the hover hint below the bar
+        ]
+        self._last_view = None
         self.setup_network()
         self.wave_timer = 0
         self.last_spawn_time = 0
@@ -129,6 +149,8 @@ class PacketDefender:
         self.last_collectible_spawn = 0
         self.wave_damage_taken = 0
         self.wave_packets_blocked = 0
+        self._last_stats = None # Last values pushed to the stats panel
+        self._pkt_count = 0 # len(self.packets), refreshed once per frame
 
     def load_high_score(self):
         try:
@@ -359,7 +381,7 @@ class PacketDefender:
         else: self.state = "VICTORY"; self.ui_log.add_log("NETWORK SECURED!", "success")
 
     def spawn_packet(self):
-        if len(self.packets) > 100: return # Hard safety limit to prevent explosion
+        if self._pkt_count > 100: return # Hard safety limit to prevent explosion
         now = pygame.time.get_ticks(); wave = WAVES[self.current_wave_idx]
         if (wave["duration"] * FPS - self.wave_timer) / FPS < 2.0: return
         prog = 1.0 - (self.wave_timer / (wave["duration"] * FPS))
@@ -375,8 +397,8 @@ class PacketDefender:
                 if info:
                     p.attack_id = attack_id; p.threat_name = info["name"]; p.recolor(info["color"])
                     p.threat_severity = info["severity"]; p.threat_damage = info["damage"]
-                    p.source_ip = f"{random.randint(1,255)}.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,255)}"
-            self.packets.add(p)
+                    p.source_ip = random_source_ip()
+            self.packets.add(p); self._pkt_count += 1
 
     def spawn_booster(self):
         if random.random() > 0.15: return # Further throttle booster spawning
@@ -388,7 +410,7 @@ class PacketDefender:
         self.intel_items.add(IntelSprite(cx, itype))
 
     def pull_sniffer_packets(self):
-        if len(self.packets) > 100: return
+        if self._pkt_count > 100: return
         # Limit packets pulled per frame to prevent lag spikes
         max_pull = 5 # Reduced from 10
         count = 0
@@ -398,7 +420,8 @@ class PacketDefender:
             # Only spawn some of the sniffed packets to reduce load
             if random.random() < 0.3:
                 ps = PacketSprite(0, 350 + random.randint(-40, 40), self.node_router.x, self.node_router.y, PacketType.SUSPICIOUS, ip=p_data.src_ip)
-                self.packets.add(ps)
+                self.packets.add(ps); self._pkt_count += 1
+            p_data.release() # Sprite only keeps the IP string; recycles simulated packets only
             count += 1
 
     def update(self):
@@ -416,10 +439,11 @@ class PacketDefender:
             return
             
         # UI updates that should run even when paused
+        mpos = pygame.mouse.get_pos()
         self.ui_toggle.update()
-        self.ui_actions.update(pygame.mouse.get_pos(), pygame.mouse.get_pressed())
-        self.ui_defense_bar.update(self.defense_engine, pygame.mouse.get_pos())
-        self.ui_firewall.update(pygame.mouse.get_pos())
+        self.ui_actions.update(mpos) # Reads button state only when the cursor is over the group
+        self.ui_defense_bar.update(self.defense_engine, mpos)
+        self.ui_firewall.update(mpos)
         self.ui_health.update()
         self.ui_threat.update()
         
@@ -440,7 +464,9 @@ class PacketDefender:
         else:
             self.cpu_usage = max(0.0, self.cpu_usage - 0.2)
             
-        self.ram_usage = min(100.0, (len(self.packets) / 40.0) * 100.0)
+        # Packet count memoized once per frame; spawners bump it as they add
+        self._pkt_count = len(self.packets)
+        self.ram_usage = min(100.0, (self._pkt_count / 40.0) * 100.0)
         self.spawn_packet()
         
         if random.random() < 0.005: self.spawn_booster()
@@ -460,20 +486,20 @@ class PacketDefender:
         if self.auto_block_timer > 0: self.auto_block_timer -= 1
         
         p_scale = 0.4 if self.slow_timer > 0 else 1.0
+        # Single pass: movement, routing, damage, culling and hostile count
+        router_x, fw_x, server_x = self.node_router.x, self.node_fw.x, self.node_server.x
+        is_auto_mode = self.auto_defense or self.auto_block_timer > 0
+        hostile_count = 0
         for p in self.packets:
             p.update(p_scale)
             if p.reached_target and not p.is_blocked:
-                if p.target_x == self.node_router.x:
-                    p.target_x, p.target_y = self.node_fw.x, self.node_fw.y
-                    p.vx = (p.target_x - p.x) / 30
-                    p.vy = (p.target_y - p.y) / 30
-                    p.reached_target = False
-                elif p.target_x == self.node_fw.x:
+                if p.target_x == router_x:
+                    p.set_course(self.node_fw.x, self.node_fw.y, 30)
+                elif p.target_x == fw_x:
                     blocked, rule_name, info, eff = self.defense_engine.inspect_packet(p.attack_id, p.source_ip)
                     
                     # If auto-defense mode is ON, it can block even if rules are disabled
-                    is_auto_mode = self.auto_defense or self.auto_block_timer > 0
-                    if is_auto_mode and p.is_hostile() and not blocked:
+                    if is_auto_mode and p.hostile and not blocked:
                         blocked = True
                         rule_name = "AUTO-SYSTEM"
                         eff = 1.0
@@ -492,7 +518,7 @@ class PacketDefender:
                         self.ui_terminal.add_entry(msg, "blocked")
                         log_event(EventType.BLOCK.value, msg)
                     else:
-                        if p.is_hostile():
+                        if p.hostile:
                             # Attack passed firewall - log why
                             missing = rule_name if rule_name else "No countermeasure"
                             msg = f"ALERT: {p.threat_name} from {p.source_ip} - RULE DISABLED [{missing}]"
@@ -501,12 +527,9 @@ class PacketDefender:
                             self.ui_log.add_log(f"ALERT: {p.threat_name} Bypassed FW", "danger")
                             log_event(EventType.ATTACK.value, f"{p.threat_name} bypassed firewall (Rule: {missing})")
                         
-                        p.target_x, p.target_y = self.node_server.x, self.node_server.y
-                        p.vx = (p.target_x - p.x) / 40
-                        p.vy = (p.target_y - p.y) / 40
-                        p.reached_target = False
-                elif p.target_x == self.node_server.x:
-                    if p.is_hostile():
+                        p.set_course(self.node_server.x, self.node_server.y, 40)
+                elif p.target_x == server_x:
+                    if p.hostile:
                         dmg = p.get_damage()
                         self.health -= dmg
                         self.wave_damage_taken += dmg
@@ -515,8 +538,11 @@ class PacketDefender:
                         self.connections.flash_hit(self.node_fw, self.node_server)
                         self.particles.emit_hit_effect(p.x, p.y)
                         if self.health < 30: self.ui_log.add_log("CRITICAL HEALTH!", "danger")
-                    p.kill()
-            if p.is_blocked and p.alpha <= 0: p.kill()
+                    p.kill(); continue
+            # Legs only run between on-screen nodes, so the one dead state to cull
+            # is a finished block fade - removed here, before it is ever drawn
+            if p.is_blocked and p.alpha <= 0: p.kill(); continue
+            if p.hostile: hostile_count += 1
             
         if self.health <= 0: 
             self.state = "GAME_OVER"
@@ -524,18 +550,25 @@ class PacketDefender:
             self.save_score()
             self.ui_game_over.show(self.score, self.packets_blocked, self.packets_leaked)
             
-        self.ui_health.set_value(self.health)
-        self.ui_threat.set_level(sum(1 for p in self.packets if p.is_hostile()) * 10)
+        if self.health != self.ui_health.value: self.ui_health.set_value(self.health)
+        threat = min(100, hostile_count * 10)
+        if threat != self.ui_threat.level: self.ui_threat.set_level(threat)
         
         wave = WAVES[self.current_wave_idx]
         self.ui_progress.set_wave(wave["num"], wave["name"], 1.0 - (self.wave_timer / (wave["duration"] * FPS)))
-        self.ui_stats.set_stats({
-            "Score": self.score, 
-            "Hi-Score": self.high_score, 
-            "CPU": f"{int(self.cpu_usage)}%", 
-            "RAM": f"{int(self.ram_usage)}%", 
-            "Wave": self.current_wave_idx + 1
-        })
+        
+        # Only rebuild the stats panel when a displayed value actually changed
+        cpu, ram = int(self.cpu_usage), int(self.ram_usage)
+        stats_key = (self.score, self.high_score, cpu, ram, self.current_wave_idx)
+        if stats_key != self._last_stats:
+            self._last_stats = stats_key
+            self.ui_stats.set_stats({
+                "Score": self.score, 
+                "Hi-Score": self.high_score, 
+                "CPU": f"{cpu}%", 
+                "RAM": f"{ram}%", 
+                "Wave": self.current_wave_idx + 1
+            })
 
 
     def end_wave(self):
@@ -548,18 +581,18 @@ class PacketDefender:
             self.ui_report.show({"wave_num": self.current_wave_idx + 1, "damage_taken": self.wave_damage_taken, "blocked": self.wave_packets_blocked, "intel": self.intel_collected, "rules_active": self.defense_engine.active_count(), "wave_score": 100*(self.current_wave_idx+1), "best_rule": "N/A"})
 
     def draw(self):
-        if self.state == "MENU": self.ui_menu.draw(self.screen); pygame.display.flip(); return
-        self.screen.fill((10, 15, 25))
-        for x in range(0, SCREEN_WIDTH, 40): pygame.draw.line(self.screen, (20, 25, 35), (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, 40): pygame.draw.line(self.screen, (20, 25, 35), (0, y), (SCREEN_WIDTH, y))
+        if self.state == "MENU": self.ui_menu.draw(self.screen); pygame.display.flip(); self._last_view = None; return
+        self.screen.blit(self.background, (0, 0))
         self.connections.draw(self.screen)
-        for p in self.packets: p.draw_trail(self.screen)
+        # All packet trails in one batched blit
+        trail_pairs = [pair for p in self.packets for pair in p.trail_blits()]
+        if trail_pairs: self.screen.blits(trail_pairs, doreturn=False)
         self.packets.draw(self.screen); self.nodes.draw(self.screen); self.boosters.draw(self.screen); self.intel_items.draw(self.screen); self.particles.draw(self.screen)
         self.ui_health.draw(self.screen); self.ui_threat.draw(self.screen); self.ui_progress.draw(self.screen); self.ui_stats.draw(self.screen); self.ui_defense_bar.draw(self.screen); self.ui_toggle.draw(self.screen); self.ui_terminal.draw(self.screen); self.ui_log.draw(self.screen); self.ui_suggestion.draw(self.screen); self.ui_notify.draw(self.screen); self.ui_adaptive.draw(self.screen); self.ui_control.draw(self.screen); self.ui_actions.draw(self.screen)
         
         if self.state in ["PLAYING", "BRIEFING", "REPORT"]:
-            score_t = self.score_font.render(f"SCORE: {self.score}", True, (255, 220, 0))
-            self.screen.blit(score_t, (SCREEN_WIDTH//2 - score_t.get_width()//2, 45))
+            score_t, score_x = self.centered_text(self.score_font, f"SCORE: {self.score}", (255, 220, 0))
+            self.screen.blit(score_t, (score_x, 45))
 
         if self.state == "BRIEFING": self.ui_briefing.draw(self.screen)
         elif self.state == "REPORT": self.ui_report.draw(self.screen)
@@ -573,12 +606,32 @@ class PacketDefender:
         if self.paused and not (self.ui_firewall.visible or self.ui_encyclopedia.visible):
             self.draw_overlay("PAUSED", Theme.NEON_YELLOW, "Press [SPACE] to resume")
             
-        pygame.display.flip()
+        self.present()
+
+    def present(self):
+        """Push the frame to the display, limited to the live regions during normal play"""
+        view = (self.state, self.paused, self.ui_firewall.visible, self.ui_encyclopedia.visible)
+        if view != self._last_view or view != ("PLAYING", False, False, False):
+            # State change, modal screen or pause overlay: repaint everything
+            self._last_view = view
+            pygame.display.flip()
+            return
+        pygame.display.update(self._live_rects)
+
+    def centered_text(self, font, text, color):
+        """Render text once and remember its horizontally centered x position"""
+        key = (font, text, color)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            if len(self._text_cache) > 256: self._text_cache.clear()
+            t = font.render(text, True, color)
+            cached = self._text_cache[key] = (t, SCREEN_WIDTH//2 - t.get_width()//2)
+        return cached
 
     def draw_overlay(self, title, color, subtext):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA); overlay.fill((0, 0, 0, 180)); self.screen.blit(overlay, (0, 0))
-        font_t = pygame.font.Font(None, 72); font_s = pygame.font.Font(None, 32); tt = font_t.render(title, True, color); st = font_s.render(subtext, True, Theme.TEXT_PRIMARY)
-        self.screen.blit(tt, (SCREEN_WIDTH//2 - tt.get_width()//2, 250)); self.screen.blit(st, (SCREEN_WIDTH//2 - st.get_width()//2, 330))
+        self.screen.blit(self.overlay_bg, (0, 0))
+        tt, tx = self.centered_text(self.overlay_font, title, color); st, sx = self.centered_text(self.overlay_sub_font, subtext, Theme.TEXT_PRIMARY)
+        self.screen.blit(tt, (tx, 250)); self.screen.blit(st, (sx, 330))
 
     def run(self):
         try:
@@ -586,6 +639,8 @@ class PacketDefender:
                 self.handle_events()
                 self.update()
                 self.draw()
+                # Fixed step: sprite and UI animation all advance per frame, so
+                # widgets take no dt (present() already limits what reaches the display)
                 self.clock.tick(FPS)
         except Exception as e:
             import traceback
@@ -35,19 +35,37 @@
 import threading
 import time
 import random
+import itertools
+import operator
 import uuid
+import math
 import sys
-from queue import Queue, Empty, Full
+import socket
+import struct
+import select
+import mmap
+import ctypes
+from collections import deque
+from queue import Empty
 from dataclasses import dataclass, field
-from typing import Optional, Callable, List, Dict, Any, Tuple
-from enum import Enum, auto
-from datetime import datetime
+from typing import Optional, Callable, List, Dict, Any, Tuple, Set
+from enum import Enum, IntEnum, auto
+from functools import lru_cache
+
+# Optional: compressed bitmap for the blocklist (C-level bit test, compact for
+# large feeds). Falls back to a plain set of ints.
+try:
+    from pyroaring import BitMap as _BlockSet
+except ImportError:
+    _BlockSet = set
 
 # Import configuration
 try:
     from config import (
-        SIMULATION_MODE, DEBUG_MODE, NETWORK_INTERFACE, BACKUP_INTERFACES,
+        SIMULATION_MODE, DEBUG_MODE, STRICT_PACKET_IDS, NETWORK_INTERFACE, BACKUP_INTERFACES,
         MAX_QUEUE_SIZE, QUEUE_TIMEOUT,
+        USE_RX_RING, RING_BLOCK_SIZE, RING_BLOCK_COUNT, RING_BLOCK_TIMEOUT_MS,
+        CAPTURE_LISTED_SOURCES_ONLY, SCAPY_BATCH_SIZE,
         NORMAL_PACKET_RATE, ATTACK_PACKET_RATE, MAX_PACKET_RATE,
         WHITELISTED_IPS, BLACKLISTED_IPS, SUSPICIOUS_IPS, SERVER_IPS,
         COLORS, THREAT_LEVELS, PROTOCOLS,
@@ -60,6 +78,141 @@ except ImportError as e:
     sys.exit(1)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#                         AF_PACKET RING CONSTANTS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Values from <linux/if_packet.h> / <linux/if_ether.h>
+SOL_PACKET = 263
+PACKET_RX_RING = 5
+PACKET_VERSION = 10
+TPACKET_V3 = 2
+ETH_P_ALL = 0x0003
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+
+SO_ATTACH_FILTER = 26
+
+# struct tpacket_req3 (7 x u32)
+_TPACKET_REQ3 = struct.Struct("=7I")
+# tpacket_block_desc: block_status, num_pkts, offset_to_first_pkt (after version/offset_to_priv)
+_BLOCK_HDR = struct.Struct("=III")
+# tpacket3_hdr: tp_next_offset, tp_sec, tp_nsec, tp_snaplen, tp_len, tp_status, tp_mac, tp_net
+_PKT_HDR = struct.Struct("=IIIIIIHH")
+# IPv4 header fields we care about: version/ihl, ttl, protocol, src, dst (as ints)
+_IP_HDR = struct.Struct("!B7xBB2xII")
+_IP_PROTOCOLS = {1: "ICMP", 6: "TCP", 17: "UDP"}
+_PORTS = struct.Struct("!HH")
+
+# struct sock_filter (classic BPF instruction) and the opcodes we emit
+_BPF_INSN = struct.Struct("=HBBI")
+_BPF_LDH_ABS = 0x28
+_BPF_LDW_ABS = 0x20
+_BPF_JEQ_K = 0x15
+_BPF_RET_K = 0x06
+_BPF_MAX_HOSTS = 250  # Jump offsets are 8-bit
+
+# TCP flag letters in the order Scapy prints them
+_TCP_FLAG_NAMES = "FSRPAUEC"
+# Flag string for every possible flags byte, so each packet shares one instance
+_TCP_FLAG_STRINGS = tuple(
+    sys.intern("".join(name for i, name in enumerate(_TCP_FLAG_NAMES) if bits >> i & 1))
+    for bits in range(256)
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                          ADDRESS CLASSIFICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# O(1) membership views of the config IP lists (the lists stay for random.choice)
+_BLACKLIST = frozenset(BLACKLISTED_IPS)
+_SERVERS = frozenset(SERVER_IPS)
+
+# RFC1918 private ranges as (network, netmask)
+_PRIVATE_NETS = (
+    (0xC0A80000, 0xFFFF0000),  # 192.168.0.0/16
+    (0x0A000000, 0xFF000000),  # 10.0.0.0/8
+    (0xAC100000, 0xFFF00000),  # 172.16.0.0/12
+)
+
+
+def _ip_to_int(ip: str) -> int:
+    """Dotted-quad IPv4 string to a 32-bit int (-1 if it isn't one)."""
+    try:
+        a, b, c, d = ip.split('.', 3)
+        return (int(a) << 24) | (int(b) << 16) | (int(c) << 8) | int(d)
+    except ValueError:
+        return -1
+
+
+_ip_to_int_cached = lru_cache(maxsize=4096)(_ip_to_int)
+
+
+@lru_cache(maxsize=4096)
+def _int_to_ip(ip_int: int) -> str:
+    """32-bit int to dotted-quad string (cached, so repeat talkers share one str)."""
+    return f"{ip_int >> 24}.{ip_int >> 16 & 255}.{ip_int >> 8 & 255}.{ip_int & 255}"
+
+
+@lru_cache(maxsize=4096)
+def _is_internal(ip: str) -> bool:
+    """True for our servers and private-range addresses."""
+    if ip in _SERVERS:
+        return True
+    ip_int = _ip_to_int(ip)
+    for net, mask in _PRIVATE_NETS:
+        if ip_int & mask == net:
+            return True
+    return False
+
+
+def _listed_sources() -> List[str]:
+    """Every source IP the classifier knows about (for kernel-side filtering)."""
+    return sorted(set(WHITELISTED_IPS) | set(SUSPICIOUS_IPS) | set(BLACKLISTED_IPS))
+
+
+def _build_bpf_program(src_hosts: List[str]) -> bytes:
+    """
+    Compile a classic BPF program for Ethernet frames that accepts IPv4,
+    optionally only from the given source hosts.
+    
+    Equivalent to tcpdump's "ip [and (src host A or src host B ...)]".
+    """
+    hosts = [_ip_to_int(ip) for ip in src_hosts]
+    hosts = [h for h in hosts if h >= 0][:_BPF_MAX_HOSTS]
+    n = len(hosts)
+    
+    insns = [(_BPF_LDH_ABS, 0, 0, 12)]                    # A = ethertype
+    if n:
+        insns.append((_BPF_JEQ_K, 0, n + 1, 0x0800))      # not IPv4 -> drop
+        insns.append((_BPF_LDW_ABS, 0, 0, 26))            # A = source address
+        for i, host in enumerate(hosts):
+            insns.append((_BPF_JEQ_K, n - i, 0, host))    # match -> accept
+    else:
+        insns.append((_BPF_JEQ_K, 1, 0, 0x0800))          # IPv4 -> accept
+    insns.append((_BPF_RET_K, 0, 0, 0))                   # drop
+    insns.append((_BPF_RET_K, 0, 0, 0x40000))             # accept whole frame
+    
+    return b"".join(_BPF_INSN.pack(*insn) for insn in insns)
+
+
+def _attach_bpf(sock: socket.socket, program: bytes) -> None:
+    """Attach a classic BPF program to a socket (SO_ATTACH_FILTER)."""
+    buf = ctypes.create_string_buffer(program, len(program))
+    # struct sock_fprog { unsigned short len; struct sock_filter *filter; }
+    fprog = struct.pack("HL", len(program) // _BPF_INSN.size, ctypes.addressof(buf))
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+
+
+def _capture_filter_expr() -> str:
+    """The same filter as _build_bpf_program, in libpcap syntax for Scapy."""
+    if not CAPTURE_LISTED_SOURCES_ONLY:
+        return "ip"
+    hosts = " or ".join(f"src host {ip}" for ip in _listed_sources())
+    return f"ip and ({hosts})" if hosts else "ip"
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                                  ENUMS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -74,7 +227,7 @@ class SnifferStatus(Enum):
     SHUTTING_DOWN = "shutting_down"
 
 
-class ThreatLevel(Enum):
+class ThreatLevel(IntEnum):
     """Threat classification levels for packets."""
     SAFE = 0
     UNKNOWN = 1
@@ -92,17 +245,136 @@ class PacketDirection(Enum):
     UNKNOWN = "unknown"
 
 
+# Packet tags - shared singletons rather than a fresh string per packet
+_TAG_WHITELISTED = sys.intern("whitelisted")
+_TAG_SUSPICIOUS = sys.intern("suspicious")
+_TAG_BLACKLISTED = sys.intern("blacklisted")
+_TAG_UNKNOWN_SOURCE = sys.intern("unknown_source")
+_TAG_BLOCKED = sys.intern("blocked")
+
+# Source IP -> (threat level, tag), merged from the config lists.
+# Filled lowest precedence first so blacklist > suspicious > whitelist.
+_SOURCE_CLASSES = {}
+for _ip in WHITELISTED_IPS:
+    _SOURCE_CLASSES[_ip] = (ThreatLevel.SAFE, _TAG_WHITELISTED)
+for _ip in SUSPICIOUS_IPS:
+    _SOURCE_CLASSES[_ip] = (ThreatLevel.HOSTILE, _TAG_SUSPICIOUS)
+for _ip in BLACKLISTED_IPS:
+    _SOURCE_CLASSES[_ip] = (ThreatLevel.CRITICAL, _TAG_BLACKLISTED)
+del _ip
+_UNKNOWN_SOURCE = (ThreatLevel.UNKNOWN, _TAG_UNKNOWN_SOURCE)
+
+# Value pools for the simulated traffic generators (random.choices indexes them)
+_EPHEMERAL_PORTS = range(49152, 65536)
+_ATTACK_SRC_PORTS = range(1024, 65536)
+_NORMAL_SIZES = range(64, 1501)
+_ATTACK_SIZES = range(40, 1501)
+_NORMAL_PROTOCOLS = ("TCP", "UDP", "TCP", "TCP")  # More TCP
+_UNICAST_FIRST_OCTETS = range(1, 224)
+_OCTETS = range(256)
+_HOST_OCTETS = range(1, 255)
+
+# Attack sources when the config has no blacklist: a fixed set of 185.x.y.z
+# addresses, formatted once so bursts draw them like any other pool value
+_FALLBACK_ATTACK_SOURCES = tuple(
+    f"185.{random.randrange(256)}.{random.randrange(256)}.{random.randrange(1, 255)}"
+    for _ in range(0 if BLACKLISTED_IPS else 1024)
+)
+
+# Per-attack burst shape: (destination ports from the pool's
+# (target_ports, web_ports, n), protocol, TCP flags), resolved once per burst
+_ATTACK_SHAPES = {
+    "BRUTE_FORCE": (lambda target, web, n: [22] * n, "TCP", ""),  # SSH
+    "SYN_FLOOD": (lambda target, web, n: web, "TCP", "SYN"),
+    "PING_FLOOD": (lambda target, web, n: target, "ICMP", ""),
+}
+_DEFAULT_ATTACK_SHAPE = (lambda target, web, n: target, "TCP", "")  # PORT_SCAN, DDOS, ...
+
+# Packet tag for each attack type
+_ATTACK_TAGS = {attack_type: sys.intern(f"attack:{attack_type.lower()}") for attack_type in ATTACK_TYPES}
+
+# Packed source IP of a packet, for C-level iteration over a batch
+_SRC_IP_INT = operator.attrgetter("src_ip_int")
+
+# 0 <= ip_int: filters out the -1 of non-IPv4 sources, which must never reach
+# the blocklist (a pyroaring BitMap only accepts unsigned 32-bit keys)
+_IS_IPV4_INT = (0).__le__
+
+# Capture thread run states (PacketSniffer._run_state)
+_RUN_ACTIVE = 0
+_RUN_PAUSED = 1
+_RUN_STOPPING = 2
+
+# Consistent-read attempts in CaptureStatistics.get_summary before it settles
+# for a best-effort read (the writer never stays mid-update that long)
+_SNAPSHOT_RETRIES = 100
+
+# Attack descriptor while no attack is running
+_NO_ATTACK: Dict[str, Any] = {"name": "Unknown", "description": ""}
+
+# Packet direction indexed by (src_internal << 1 | dst_internal)
+_DIRECTIONS = (
+    PacketDirection.EXTERNAL,
+    PacketDirection.INBOUND,
+    PacketDirection.OUTBOUND,
+    PacketDirection.INTERNAL,
+)
+
+# (color, damage, sprite) indexed by ThreatLevel, resolved once at import
+_THREAT_VIS = tuple(
+    (THREAT_LEVELS[lvl.name]["color"], THREAT_LEVELS[lvl.name]["damage"], THREAT_LEVELS[lvl.name]["sprite"])
+    if lvl.name in THREAT_LEVELS else
+    (COLORS.get("UNKNOWN", (255, 255, 0)), 1, "yellow")
+    for lvl in ThreatLevel
+)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                              PACKET DATA CLASS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# Last formatted wall-clock second, reused by _format_timestamp
+_ts_cache_sec = -1
+_ts_cache_str = ""
+
+
+def _format_timestamp(ts: float) -> str:
+    """
+    ISO-8601 local time for a packet timestamp.
+    Only the whole-second prefix goes through strftime, once per second.
+    """
+    global _ts_cache_sec, _ts_cache_str
+    sec = int(ts)
+    if sec != _ts_cache_sec:
+        _ts_cache_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache_sec = sec
+    return f"{_ts_cache_str}.{int((ts - sec) * 1e6):06d}"
+
+
+# Enum-to-text tables for to_dict()/to_log_string() (Enum .name/.value are
+# descriptor lookups, too slow to repeat for every exported packet)
+_THREAT_NAMES = tuple(level.name for level in ThreatLevel)
+_DIRECTION_VALUES = {direction: direction.value for direction in PacketDirection}
+
+
+# Cheap sequential packet IDs (uuid4 pulls from the OS entropy pool every call)
+_packet_ids = itertools.count(1)
+
+
+def _new_packet_id() -> str:
+    """8 hex digit packet ID (random if STRICT_PACKET_IDS, else sequential)."""
+    if STRICT_PACKET_IDS:
+        return uuid.uuid4().hex[:8]
+    return f"{next(_packet_ids):08x}"
+
+
 class Packet:
     """
     Represents a network packet in the simulation.
     
     This is the core data structure that flows through the entire game system
     from capture → classification → visualization → logging.
+    Uses __slots__ since one is allocated for every captured packet.
     
     Attributes:
         packet_id   : Unique identifier for this packet
@@ -119,134 +391,173 @@ class Packet:
         color       : RGB color tuple for visualization
     """
     
-    # ─── Identification ───────────────────────────────────────────────────────
-    packet_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    timestamp: float = field(default_factory=time.time)
-    
-    # ─── Network Layer Info ───────────────────────────────────────────────────
-    src_ip: str = "0.0.0.0"
-    dst_ip: str = "0.0.0.0"
-    src_port: int = 0
-    dst_port: int = 0
-    protocol: str = "TCP"
-    size: int = 64
-    ttl: int = 64
-    flags: str = ""
-    
-    # ─── Classification ───────────────────────────────────────────────────────
-    threat_level: ThreatLevel = ThreatLevel.UNKNOWN
-    direction: PacketDirection = PacketDirection.UNKNOWN
-    attack_type: str = "NONE"
-    
-    # ─── Game Properties ──────────────────────────────────────────────────────
-    is_blocked: bool = False
-    is_processed: bool = False
-    damage: int = 0
-    color: Tuple[int, int, int] = (255, 255, 255)
-    sprite_type: str = "blue"
-    
-    # ─── Metadata ─────────────────────────────────────────────────────────────
-    tags: List[str] = field(default_factory=list)
-    
-    def __post_init__(self):
-        """Automatically classify packet after creation."""
-        self._classify()
-    
-    def _classify(self) -> None:
-        """Classify packet based on source IP and set properties."""
-        # Check against IP lists
-        if self.src_ip in BLACKLISTED_IPS:
-            self.threat_level = ThreatLevel.CRITICAL
-            self.tags.append("blacklisted")
-            
-        elif self.src_ip in SUSPICIOUS_IPS:
-            self.threat_level = ThreatLevel.HOSTILE
-            self.tags.append("suspicious")
-            
-        elif self.src_ip in WHITELISTED_IPS:
-            self.threat_level = ThreatLevel.SAFE
-            self.tags.append("whitelisted")
-            
+    __slots__ = (
+        # ─── Identification ───────────────────────────────────────────────────
+        'packet_id', 'timestamp',
+        # ─── Network Layer Info ───────────────────────────────────────────────
+        'src_ip', 'dst_ip', 'src_port', 'dst_port', 'protocol', 'size', 'ttl', 'flags',
+        # ─── Classification ───────────────────────────────────────────────────
+        'threat_level', 'direction', 'attack_type',
+        # ─── Game Properties ──────────────────────────────────────────────────
+        'is_blocked', 'is_processed', 'damage', 'color', 'sprite_type',
+        # ─── Metadata ─────────────────────────────────────────────────────────
+        'tags', '_src_ip_int', '_pooled',
+    )
+    
+    # Recycled instances for simulated traffic (see acquire/release)
+    _pool: deque = deque(maxlen=8192)
+    
+    def __init__(
+        self,
+        packet_id: Optional[str] = None,
+        timestamp: Optional[float] = None,
+        src_ip: str = "0.0.0.0",
+        dst_ip: str = "0.0.0.0",
+        src_port: int = 0,
+        dst_port: int = 0,
+        protocol: str = "TCP",
+        size: int = 64,
+        ttl: int = 64,
+        flags: str = "",
+        threat_level: ThreatLevel = ThreatLevel.UNKNOWN,
+        direction: PacketDirection = PacketDirection.UNKNOWN,
+        attack_type: str = "NONE",
+        is_blocked: bool = False,
+        is_processed: bool = False,
+        damage: int = 0,
+        color: Tuple[int, int, int] = (255, 255, 255),
+        sprite_type: str = "blue",
+        tags: Optional[List[str]] = None,
+        classify: bool = True,
+        src_ip_int: Optional[int] = None,
+    ):
+        self.packet_id = packet_id if packet_id is not None else _new_packet_id()
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.src_ip = src_ip
+        self.dst_ip = dst_ip
+        self.src_port = src_port
+        self.dst_port = dst_port
+        self.protocol = protocol
+        self.size = size
+        self.ttl = ttl
+        self.flags = flags
+        self.threat_level = threat_level
+        self.direction = direction
+        self.attack_type = attack_type
+        self.is_blocked = is_blocked
+        self.is_processed = is_processed
+        self.damage = damage
+        self.color = color
+        self.sprite_type = sprite_type
+        self.tags = tags
+        self._src_ip_int = src_ip_int  # Parsed on first use unless the capture layer had it
+        self._pooled = False  # Set by acquire(); only pooled packets are recycled
+        
+        # Automatically classify packet after creation, unless the caller
+        # will classify a whole batch at once (see _classify_batch)
+        if classify:
+            self._classify()
+    
+    @classmethod
+    def acquire(cls, **fields) -> "Packet":
+        """
+        Build a packet, reusing a released instance when one is available.
+        Takes the same keyword arguments as the constructor.
+        """
+        try:
+            packet = cls._pool.pop()
+        except IndexError:
+            packet = cls.__new__(cls)
+        packet.__init__(**fields)
+        packet._pooled = True
+        return packet
+    
+    def release(self) -> None:
+        """
+        Hand this packet back for reuse by acquire().
+        No-op for packets that weren't built by acquire() (real captures) or
+        were already released. Consumers must not keep a reference to a
+        packet after releasing it: its fields are overwritten on reuse.
+        """
+        if self._pooled:
+            self._pooled = False
+            Packet._pool.append(self)
+    
+    @property
+    def src_ip_int(self) -> int:
+        """Source address as a 32-bit int (-1 if it isn't IPv4)."""
+        if self._src_ip_int is None:
+            self._src_ip_int = _ip_to_int_cached(self.src_ip)
+        return self._src_ip_int
+    
+    def _add_tag(self, tag: str) -> None:
+        """Append a tag, allocating the list on first use."""
+        if self.tags is None:
+            self.tags = [tag]
         else:
-            self.threat_level = ThreatLevel.UNKNOWN
-            self.tags.append("unknown_source")
+            self.tags.append(tag)
+    
+    def _classify(
+        self,
+        _lookup=_SOURCE_CLASSES.get,
+        _unknown=_UNKNOWN_SOURCE,
+        _internal=_is_internal,
+        _directions=_DIRECTIONS,
+        _visuals=_THREAT_VIS,
+    ) -> None:
+        """
+        Classify packet based on source IP and set properties.
+        Hot path for every packet: the lookup tables are bound as default
+        arguments (locals, not globals) and the helper steps are inlined.
+        """
+        # Check against IP lists (one probe into the merged table)
+        level, tag = _lookup(self.src_ip, _unknown)
+        self.threat_level = level
+        if self.tags is None:
+            self.tags = [tag]
+        else:
+            self.tags.append(tag)
         
         # Determine direction
-        self._determine_direction()
+        self.direction = _directions[_internal(self.src_ip) << 1 | _internal(self.dst_ip)]
         
         # Set color and damage based on threat level
-        self._set_visual_properties()
-    
-    def _determine_direction(self) -> None:
-        """Determine packet direction."""
-        src_internal = (
-            self.src_ip in SERVER_IPS or 
-            self.src_ip.startswith("192.168.") or
-            self.src_ip.startswith("10.") or
-            self.src_ip.startswith("172.16.")
-        )
-        dst_internal = (
-            self.dst_ip in SERVER_IPS or 
-            self.dst_ip.startswith("192.168.") or
-            self.dst_ip.startswith("10.") or
-            self.dst_ip.startswith("172.16.")
-        )
-        
-        if src_internal and dst_internal:
-            self.direction = PacketDirection.INTERNAL
-        elif dst_internal:
-            self.direction = PacketDirection.INBOUND
-        elif src_internal:
-            self.direction = PacketDirection.OUTBOUND
-        else:
-            self.direction = PacketDirection.EXTERNAL
-    
-    def _set_visual_properties(self) -> None:
-        """Set color, damage, and sprite based on threat level."""
-        threat_name = self.threat_level.name
-        
-        if threat_name in THREAT_LEVELS:
-            threat_config = THREAT_LEVELS[threat_name]
-            self.color = threat_config["color"]
-            self.damage = threat_config["damage"]
-            self.sprite_type = threat_config["sprite"]
-        else:
-            self.color = COLORS.get("UNKNOWN", (255, 255, 0))
-            self.damage = 1
-            self.sprite_type = "yellow"
+        self.color, self.damage, self.sprite_type = _visuals[level]
     
     def mark_blocked(self) -> None:
         """Mark this packet as blocked by firewall."""
         self.is_blocked = True
         self.damage = 0  # Blocked packets do no damage
         self.color = COLORS.get("BLOCKED", (128, 128, 128))
-        self.tags.append("blocked")
+        self._add_tag(_TAG_BLOCKED)
     
     def mark_processed(self) -> None:
         """Mark this packet as processed by the game."""
         self.is_processed = True
     
-    def get_age(self) -> float:
-        """Get packet age in seconds."""
-        return time.time() - self.timestamp
+    def get_age(self, now: Optional[float] = None) -> float:
+        """Get packet age in seconds (pass `now` to reuse a clock reading)."""
+        return (now or time.time()) - self.timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert packet to dictionary for logging/JSON."""
+        # A literal with constant keys compiles to a single prebuilt-key-map
+        # build, which beats dict(zip(keys, values))
         return {
             "id": self.packet_id,
-            "timestamp": "",
+            "timestamp": _format_timestamp(self.timestamp),
             "src_ip": self.src_ip,
             "dst_ip": self.dst_ip,
             "src_port": self.src_port,
             "dst_port": self.dst_port,
             "protocol": self.protocol,
             "size": self.size,
-            "threat_level": self.threat_level.name,
-            "direction": self.direction.value,
+            "threat_level": _THREAT_NAMES[self.threat_level],
+            "direction": _DIRECTION_VALUES[self.direction],
             "attack_type": self.attack_type,
             "is_blocked": self.is_blocked,
             "damage": self.damage,
-            "tags": self.tags,
+            "tags": self.tags if self.tags is not None else [],
         }
     
     def to_log_string(self) -> str:
@@ -255,22 +566,121 @@ class Packet:
         return (
             f"[{self.packet_id}] "
             f"{self.src_ip}:{self.src_port} → {self.dst_ip}:{self.dst_port} | "
-            f"{self.protocol} | {self.threat_level.name} | {status}"
+            f"{self.protocol} | {_THREAT_NAMES[self.threat_level]} | {status}"
         )
     
     def __str__(self) -> str:
         return f"Packet({self.src_ip} → {self.dst_ip}, {self.threat_level.name})"
 
 
+def _classify_batch(packets: List[Packet]) -> None:
+    """
+    Classify packets that were built with classify=False, in one pass.
+    Same result as Packet._classify, with the table lookups hoisted out
+    of the loop instead of repeated per call.
+    """
+    lookup = _SOURCE_CLASSES.get
+    unknown = _UNKNOWN_SOURCE
+    internal = _is_internal
+    directions = _DIRECTIONS
+    visuals = _THREAT_VIS
+    
+    for packet in packets:
+        level, tag = lookup(packet.src_ip, unknown)
+        packet.threat_level = level
+        if packet.tags is None:
+            packet.tags = [tag]
+        else:
+            packet.tags.append(tag)
+        packet.direction = directions[internal(packet.src_ip) << 1 | internal(packet.dst_ip)]
+        packet.color, packet.damage, packet.sprite_type = visuals[level]
+
+
+def _classify_attack_batch(packets: List[Packet], attack_tag: str) -> None:
+    """
+    Classify a burst of attack packets in one pass.
+    Attack traffic is always hostile (critical from blacklisted sources),
+    so the threat level and visuals are set here directly instead of
+    classifying normally and then overriding each packet.
+    """
+    lookup = _SOURCE_CLASSES.get
+    unknown = _UNKNOWN_SOURCE
+    internal = _is_internal
+    directions = _DIRECTIONS
+    blacklist = _BLACKLIST
+    critical = (ThreatLevel.CRITICAL,) + _THREAT_VIS[ThreatLevel.CRITICAL]
+    hostile = (ThreatLevel.HOSTILE,) + _THREAT_VIS[ThreatLevel.HOSTILE]
+    
+    for packet in packets:
+        src_ip = packet.src_ip
+        packet.tags = [lookup(src_ip, unknown)[1], attack_tag]
+        packet.direction = directions[internal(src_ip) << 1 | internal(packet.dst_ip)]
+        packet.threat_level, packet.color, packet.damage, packet.sprite_type = (
+            critical if src_ip in blacklist else hostile
+        )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                              STATISTICS CLASS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class _HyperLogLog:
+    """
+    Fixed-size distinct counter for source IPs (HyperLogLog, ~1% error).
+    Uses 16 KiB regardless of how many addresses a scan sprays at us,
+    where a set would grow without bound.
+    """
+    
+    P = 14
+    M = 1 << P
+    _MASK = (1 << 64) - 1
+    _LOW = (1 << (64 - P)) - 1
+    _ALPHA = 0.7213 / (1 + 1.079 / M)
+    _POW = [2.0 ** -r for r in range(65)]
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self) -> None:
+        self.registers = bytearray(self.M)
+        self._sum = float(self.M)   # Running sum of 2^-register
+        self._zeros = self.M
+    
+    def add(self, ip: str) -> None:
+        x = _ip_to_int(ip)
+        if x < 0:
+            x = hash(ip)
+        # splitmix64 finalizer - spreads sequential addresses over all registers
+        x = (x + 0x9E3779B97F4A7C15) & self._MASK
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & self._MASK
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & self._MASK
+        x ^= x >> 31
+        
+        idx = x >> (64 - self.P)
+        # Leading-zero count of the remaining 64-P bits, plus one
+        rank = 65 - self.P - (x & self._LOW).bit_length()
+        old = self.registers[idx]
+        if rank > old:
+            self.registers[idx] = rank
+            self._sum += self._POW[rank] - self._POW[old]
+            if old == 0:
+                self._zeros -= 1
+    
+    def __len__(self) -> int:
+        estimate = self._ALPHA * self.M * self.M / self._sum
+        if estimate <= 2.5 * self.M and self._zeros:
+            # Small-range correction (linear counting)
+            estimate = self.M * math.log(self.M / self._zeros)
+        return int(round(estimate))
+
+
 @dataclass
 class CaptureStatistics:
     """
     Real-time statistics about packet capture.
-    Thread-safe and updated continuously.
+    Written by the capture thread, read lock-free via a sequence counter.
+    Other threads never write the counters: PacketSniffer.reset_statistics
+    swaps in a fresh instance instead of resetting this one.
     """
     total_captured: int = 0
     total_blocked: int = 0
@@ -278,92 +688,278 @@ class CaptureStatistics:
     total_damage: int = 0
     damage_prevented: int = 0
     
-    packets_per_second: float = 0.0
     peak_pps: float = 0.0
     
-    safe_count: int = 0
-    unknown_count: int = 0
-    suspicious_count: int = 0
-    hostile_count: int = 0
-    critical_count: int = 0
+    # Packets seen per threat level, indexed by ThreatLevel
+    threat_counts: List[int] = field(default_factory=lambda: [0] * len(ThreatLevel))
     
-    unique_sources: set = field(default_factory=set)
+    unique_sources: _HyperLogLog = field(default_factory=_HyperLogLog)
     start_time: float = field(default_factory=time.time)
     
-    _lock: threading.Lock = field(default_factory=threading.Lock)
+    # Sequence counter: the capture thread is the only writer and bumps it to
+    # odd while updating, so readers can take a consistent snapshot without a lock
+    _seq: int = 0
+    
+    # Guards peak_pps, the only field readers write (a high-water mark of the
+    # rates reported by get_summary)
+    _peak_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
     
     def update(self, packet: Packet) -> None:
-        """Thread-safe update with new packet data."""
-        with self._lock:
-            self.total_captured += 1
-            self.unique_sources.add(packet.src_ip)
-            
+        """Update with new packet data (capture thread only)."""
+        self._seq += 1
+        self.total_captured += 1
+        self.unique_sources.add(packet.src_ip)
+        
+        if packet.is_blocked:
+            self.total_blocked += 1
+            self.damage_prevented += packet.damage
+        else:
+            self.total_allowed += 1
+            self.total_damage += packet.damage
+        
+        # Update threat counts
+        self.threat_counts[packet.threat_level] += 1
+        self._seq += 1
+    
+    def add_blocked(self, count: int) -> None:
+        """Count packets dropped at the blocklist gate (capture thread only)."""
+        self._seq += 1
+        self.total_captured += count
+        self.total_blocked += count
+        self._seq += 1
+    
+    def update_batch(self, packets: List[Packet]) -> None:
+        """
+        Fold a whole batch of packets into the counters (capture thread only).
+        Tallies into local column counters first, then publishes them together.
+        (One loop over the batch measured no slower than Counter/sum(map(...))
+        passes per column at simulation burst sizes.)
+        """
+        if not packets:
+            return
+        
+        levels = [0] * len(ThreatLevel)
+        blocked = damage = prevented = 0
+        add_source = self.unique_sources.add
+        for packet in packets:
+            levels[packet.threat_level] += 1
+            add_source(packet.src_ip)
             if packet.is_blocked:
-                self.total_blocked += 1
-                self.damage_prevented += packet.damage
+                blocked += 1
+                prevented += packet.damage
             else:
-                self.total_allowed += 1
-                self.total_damage += packet.damage
-            
-            # Update threat counts
-            if packet.threat_level == ThreatLevel.SAFE:
-                self.safe_count += 1
-            elif packet.threat_level == ThreatLevel.UNKNOWN:
-                self.unknown_count += 1
-            elif packet.threat_level == ThreatLevel.SUSPICIOUS:
-                self.suspicious_count += 1
-            elif packet.threat_level == ThreatLevel.HOSTILE:
-                self.hostile_count += 1
-            elif packet.threat_level == ThreatLevel.CRITICAL:
-                self.critical_count += 1
-    
-    def calculate_pps(self) -> None:
-        """Calculate current packets per second."""
-        elapsed = time.time() - self.start_time
-        if elapsed > 0:
-            self.packets_per_second = self.total_captured / elapsed
-            self.peak_pps = max(self.peak_pps, self.packets_per_second)
+                damage += packet.damage
+        
+        self._seq += 1
+        self.total_captured += len(packets)
+        self.total_blocked += blocked
+        self.total_allowed += len(packets) - blocked
+        self.total_damage += damage
+        self.damage_prevented += prevented
+        counts = self.threat_counts
+        for level, count in enumerate(levels):
+            counts[level] += count
+        self._seq += 1
+    
+    def calculate_pps(self, now: Optional[float] = None) -> float:
+        """Average packets per second since start_time (0.0 before any time has passed)."""
+        elapsed = (now or time.time()) - self.start_time
+        return self.total_captured / elapsed if elapsed > 0 else 0.0
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Counter fields as a summary dict (see get_summary for consistency)."""
+        return {
+            "total_captured": self.total_captured,
+            "total_blocked": self.total_blocked,
+            "total_allowed": self.total_allowed,
+            "block_percentage": round((self.total_blocked / max(1, self.total_captured)) * 100, 1),
+            "total_damage": self.total_damage,
+            "damage_prevented": self.damage_prevented,
+            "unique_sources": len(self.unique_sources),
+            "threat_breakdown": {
+                "safe": self.threat_counts[ThreatLevel.SAFE],
+                "unknown": self.threat_counts[ThreatLevel.UNKNOWN],
+                "suspicious": self.threat_counts[ThreatLevel.SUSPICIOUS],
+                "hostile": self.threat_counts[ThreatLevel.HOSTILE],
+                "critical": self.threat_counts[ThreatLevel.CRITICAL],
+            }
+        }
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get summary dictionary."""
-        self.calculate_pps()
-        with self._lock:
-            return {
-                "total_captured": self.total_captured,
-                "total_blocked": self.total_blocked,
-                "total_allowed": self.total_allowed,
-                "block_percentage": round((self.total_blocked / max(1, self.total_captured)) * 100, 1),
-                "total_damage": self.total_damage,
-                "damage_prevented": self.damage_prevented,
-                "packets_per_second": round(self.packets_per_second, 1),
-                "peak_pps": round(self.peak_pps, 1),
-                "unique_sources": len(self.unique_sources),
-                "uptime_seconds": int(time.time() - self.start_time),
-                "threat_breakdown": {
-                    "safe": self.safe_count,
-                    "unknown": self.unknown_count,
-                    "suspicious": self.suspicious_count,
-                    "hostile": self.hostile_count,
-                    "critical": self.critical_count,
-                }
-            }
+        """
+        Get summary dictionary. Retries while the writer is mid-update, and
+        falls back to a best-effort read after _SNAPSHOT_RETRIES attempts
+        rather than waiting on the writer indefinitely.
+        """
+        for _ in range(_SNAPSHOT_RETRIES):
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)  # Let the writer finish
+                continue
+            summary = self._snapshot()
+            if self._seq == seq:
+                break
+        else:
+            summary = self._snapshot()
+        
+        now = time.time()
+        pps = self.calculate_pps(now)
+        with self._peak_lock:
+            if pps > self.peak_pps:
+                self.peak_pps = pps
+            peak = self.peak_pps
+        summary["packets_per_second"] = round(pps, 1)
+        summary["peak_pps"] = round(peak, 1)
+        summary["uptime_seconds"] = int(now - self.start_time)
+        return summary
     
     def reset(self) -> None:
-        """Reset all statistics."""
-        with self._lock:
-            self.total_captured = 0
-            self.total_blocked = 0
-            self.total_allowed = 0
-            self.total_damage = 0
-            self.damage_prevented = 0
-            self.packets_per_second = 0.0
-            self.safe_count = 0
-            self.unknown_count = 0
-            self.suspicious_count = 0
-            self.hostile_count = 0
-            self.critical_count = 0
-            self.unique_sources.clear()
-            self.start_time = time.time()
+        """
+        Reset all statistics in place (capture thread only, or while capture
+        is stopped - see reset_statistics for other threads).
+        """
+        self._seq += 1
+        self.total_captured = 0
+        self.total_blocked = 0
+        self.total_allowed = 0
+        self.total_damage = 0
+        self.damage_prevented = 0
+        self.threat_counts = [0] * len(ThreatLevel)
+        self.unique_sources.clear()
+        self.start_time = time.time()
+        self._seq += 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                              RANDOM VALUE POOL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _RandomPool:
+    """
+    Pre-drawn random values for the traffic generators, refilled in bulk.
+    
+    Each column is drawn POOL_SIZE values at a time with one random.choices
+    call, and bursts just slice the next rows off, so the generators make
+    no per-packet RNG calls. A column whose population is None holds
+    uniform floats in [0, 1).
+    """
+    
+    POOL_SIZE = 4096
+    
+    def __init__(self, **populations):
+        self._populations = populations
+        self._refill()
+    
+    def _refill(self) -> None:
+        size = self.POOL_SIZE
+        self._columns = [
+            [random.random() for _ in range(size)] if population is None
+            else random.choices(population, k=size)
+            for population in self._populations.values()
+        ]
+        self._pos = 0
+    
+    def take(self, n: int) -> List[list]:
+        """Next `n` rows, as one list per column (in declaration order)."""
+        if self._pos + n > self.POOL_SIZE:
+            self._refill()
+        start = self._pos
+        self._pos = end = start + n
+        return [column[start:end] for column in self._columns]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#                              PACKET RING BUFFER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class PacketRing:
+    """
+    Bounded packet buffer with drop-oldest overflow, shared between the
+    capture thread (producer) and the game (consumer).
+    
+    Backed by collections.deque(maxlen=N): append/extend/popleft are single
+    C calls, atomic under the GIL, and maxlen *is* drop-oldest - so neither
+    side takes a lock and the capture thread never blocks. The game only
+    cares about recent traffic anyway.
+    
+    Implements the subset of the queue.Queue API the game uses.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = max(1, maxsize)
+        self._items: deque = deque(maxlen=self.maxsize)
+        self._ready = threading.Event()
+        self._waiting = False
+    
+    # ─── Producer side ────────────────────────────────────────────────────────
+    
+    def put_nowait(self, packet: Packet) -> None:
+        """Add a packet, evicting the oldest one if full. Never blocks."""
+        self._items.append(packet)
+        if self._waiting:
+            self._ready.set()
+    
+    def put_many(self, packets: List[Packet]) -> None:
+        """Add a batch of packets in one call."""
+        self._items.extend(packets)
+        if self._waiting:
+            self._ready.set()
+    
+    # ─── Consumer side ────────────────────────────────────────────────────────
+    
+    def get_nowait(self) -> Packet:
+        """Remove and return the oldest packet. Raises Empty if there is none."""
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise Empty from None
+    
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Packet:
+        """Like get_nowait, optionally waiting up to `timeout` seconds."""
+        try:
+            return self.get_nowait()
+        except Empty:
+            if not block:
+                raise
+        
+        self._waiting = True
+        self._ready.clear()
+        try:
+            # Re-check after clearing so a put in between isn't missed
+            if not self._items and not self._ready.wait(timeout):
+                raise Empty
+        finally:
+            self._waiting = False
+        return self.get_nowait()
+    
+    def drain(self) -> List[Packet]:
+        """Remove and return everything currently buffered, oldest first."""
+        popleft = self._items.popleft
+        packets = []
+        # Bounded by the length now; anything appended meanwhile waits for next time
+        for _ in range(len(self._items)):
+            try:
+                packets.append(popleft())
+            except IndexError:
+                break
+        return packets
+    
+    def peek(self, count: int) -> List[Packet]:
+        """Return up to `count` of the oldest packets without removing them."""
+        try:
+            return list(itertools.islice(self._items, count))
+        except RuntimeError:
+            # Producer appended mid-iteration
+            return []
+    
+    def qsize(self) -> int:
+        return len(self._items)
+    
+    def empty(self) -> bool:
+        return not self._items
+    
+    def full(self) -> bool:
+        return len(self._items) >= self.maxsize
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -398,14 +994,15 @@ class PacketSniffer:
         self.simulation_mode = simulation_mode if simulation_mode is not None else SIMULATION_MODE
         self.interface = NETWORK_INTERFACE
         self._scapy_available = False
+        self._scapy_api: Optional[tuple] = None  # (AsyncSniffer, IP, TCP, UDP, ICMP), bound once
         
-        # ─── Thread-Safe Queue ────────────────────────────────────────────────
-        self.packet_queue: Queue = Queue(maxsize=MAX_QUEUE_SIZE)
+        # ─── Lock-Free Packet Ring ────────────────────────────────────────────
+        self.packet_queue: PacketRing = PacketRing(MAX_QUEUE_SIZE)
         
         # ─── Threading Control ────────────────────────────────────────────────
         self._capture_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._pause_event = threading.Event()
+        self._run_state = _RUN_ACTIVE  # Capture loops test this one int per tick
+        self._stop_event = threading.Event()  # Only wakes loops sleeping on it
         self._lock = threading.Lock()
         
         # ─── Status ───────────────────────────────────────────────────────────
@@ -415,15 +1012,44 @@ class PacketSniffer:
         
         # ─── Rate Control ─────────────────────────────────────────────────────
         self._current_rate = NORMAL_PACKET_RATE
+        self._now: float = 0.0  # Clock reading shared by everything in one capture tick
+        
+        # ─── Simulated Traffic Randomness ─────────────────────────────────────
+        self._normal_pool = _RandomPool(
+            roll=None,
+            dst_ip=SERVER_IPS,
+            src_port=_EPHEMERAL_PORTS,
+            dst_port=SAFE_PORTS,
+            protocol=_NORMAL_PROTOCOLS,
+            size=_NORMAL_SIZES,
+            safe_src=WHITELISTED_IPS,
+            suspicious_src=SUSPICIOUS_IPS or None,
+            # Octets for random unknown sources
+            octet1=_UNICAST_FIRST_OCTETS,
+            octet2=_OCTETS,
+            octet3=_OCTETS,
+            octet4=_HOST_OCTETS,
+        )
+        self._attack_pool = _RandomPool(
+            src_ip=BLACKLISTED_IPS or _FALLBACK_ATTACK_SOURCES,
+            dst_ip=SERVER_IPS,
+            src_port=_ATTACK_SRC_PORTS,
+            size=_ATTACK_SIZES,
+            target_port=ATTACK_TARGET_PORTS,
+            web_port=(80, 443),
+        )
         
         # ─── Attack Simulation ────────────────────────────────────────────────
         self._attack_active = False
         self._attack_type: Optional[str] = None
-        self._attack_start_time: float = 0
-        self._attack_duration: float = 0
+        self._attack_start_ns: int = 0  # time.monotonic_ns() at trigger (immune to clock changes)
+        self._attack_duration_ns: int = 0
+        self._attack_desc: Dict[str, Any] = _NO_ATTACK  # ATTACK_TYPES entry, cached for get_attack_info
         
         # ─── Blocked IPs (Integration with Firewall) ──────────────────────────
-        self._blocked_ips: set = set()
+        # Packed IPv4 addresses. Replaced (copy-on-write) rather than mutated,
+        # so the capture thread can test membership without the lock.
+        self._blocked_ips: Set[int] = _BlockSet()
         
         # ─── Callbacks ────────────────────────────────────────────────────────
         self._on_packet_callback: Optional[Callable[[Packet], None]] = None
@@ -449,11 +1075,13 @@ class PacketSniffer:
             return  # Don't need Scapy in simulation mode
         
         try:
-            from scapy.all import sniff, IP, TCP, UDP, ICMP, conf
+            from scapy.all import AsyncSniffer, IP, TCP, UDP, ICMP, conf
             
             # Disable Scapy warnings
             conf.verb = 0
             
+            # Keep the classes the capture loop needs, so restarts don't import again
+            self._scapy_api = (AsyncSniffer, IP, TCP, UDP, ICMP)
             self._scapy_available = True
             
             if DEBUG_MODE:
@@ -461,6 +1089,11 @@ class PacketSniffer:
                 
         except ImportError:
             self._scapy_available = False
+            if USE_RX_RING and hasattr(socket, "AF_PACKET"):
+                # The AF_PACKET ring parses headers itself and doesn't need Scapy
+                if DEBUG_MODE:
+                    print("[PacketSniffer] Scapy not installed - using AF_PACKET ring capture")
+                return
             self._last_error = "Scapy not installed. Install with: pip install scapy"
             print(f"[PacketSniffer] WARNING: {self._last_error}")
             print("[PacketSniffer] Falling back to simulation mode")
@@ -476,18 +1109,20 @@ class PacketSniffer:
         """Try to find a working network interface."""
         interfaces_to_try = [NETWORK_INTERFACE] + BACKUP_INTERFACES
         
-        for iface in interfaces_to_try:
+        try:
+            from scapy.all import get_if_list
+            available = get_if_list()
+        except Exception:
             try:
-                from scapy.all import get_if_list
-                available = get_if_list()
-                
-                if iface in available:
-                    if DEBUG_MODE:
-                        print(f"[PacketSniffer] Using interface: {iface}")
-                    return iface
-                    
+                available = [name for _, name in socket.if_nameindex()]
             except Exception:
-                continue
+                return None
+        
+        for iface in interfaces_to_try:
+            if iface in available:
+                if DEBUG_MODE:
+                    print(f"[PacketSniffer] Using interface: {iface}")
+                return iface
         
         return None
     
@@ -514,8 +1149,8 @@ class PacketSniffer:
         
         try:
             self.status = SnifferStatus.STARTING
+            self._run_state = _RUN_ACTIVE
             self._stop_event.clear()
-            self._pause_event.clear()
             
             # Choose capture method
             if self.simulation_mode:
@@ -564,6 +1199,8 @@ class PacketSniffer:
         
         try:
             self.status = SnifferStatus.SHUTTING_DOWN
+            with self._lock:
+                self._run_state = _RUN_STOPPING
             self._stop_event.set()
             
             # Wait for thread to finish
@@ -585,7 +1222,9 @@ class PacketSniffer:
     def pause(self) -> None:
         """Pause packet capture (queue remains accessible)."""
         if self.status == SnifferStatus.RUNNING:
-            self._pause_event.set()
+            with self._lock:
+                if self._run_state == _RUN_ACTIVE:
+                    self._run_state = _RUN_PAUSED
             self.status = SnifferStatus.PAUSED
             if DEBUG_MODE:
                 print("[PacketSniffer] Paused")
@@ -593,7 +1232,9 @@ class PacketSniffer:
     def resume(self) -> None:
         """Resume paused packet capture."""
         if self.status == SnifferStatus.PAUSED:
-            self._pause_event.clear()
+            with self._lock:
+                if self._run_state == _RUN_PAUSED:
+                    self._run_state = _RUN_ACTIVE
             self.status = SnifferStatus.RUNNING
             if DEBUG_MODE:
                 print("[PacketSniffer] Resumed")
@@ -605,7 +1246,7 @@ class PacketSniffer:
         Returns:
             True if now paused, False if now running.
         """
-        if self._pause_event.is_set():
+        if self._run_state == _RUN_PAUSED:
             self.resume()
             return False
         else:
@@ -631,7 +1272,9 @@ class PacketSniffer:
             timeout: How long to wait for a packet (seconds)
         
         Returns:
-            Packet object, or None if queue is empty
+            Packet object, or None if queue is empty. Callers may hand it
+            back with packet.release() once done, and must then drop every
+            reference to it (simulated packets are reused).
         
         Example:
             packet = sniffer.get_packet()
@@ -640,6 +1283,9 @@ class PacketSniffer:
         """
         try:
             packet = self.packet_queue.get(timeout=timeout)
+            if packet.tags is None:
+                # Never classified (classification always adds a tag)
+                packet._classify()
             packet.mark_processed()
             return packet
         except Empty:
@@ -656,16 +1302,7 @@ class PacketSniffer:
         Returns:
             List of all queued packets
         """
-        packets = []
-        while not self.packet_queue.empty():
-            try:
-                packet = self.packet_queue.get_nowait()
-                packets.append(packet)
-            except Empty:
-                break
-            except Exception:
-                break
-        return packets
+        return self.packet_queue.drain()
     
     def peek_queue(self, count: int = 10) -> List[Packet]:
         """
@@ -677,9 +1314,7 @@ class PacketSniffer:
         Returns:
             List of packets (still in queue)
         """
-        with self._lock:
-            packets = list(self.packet_queue.queue)[:count]
-            return packets
+        return self.packet_queue.peek(count)
     
     def get_queue_size(self) -> int:
         """Get current number of packets in queue."""
@@ -700,14 +1335,7 @@ class PacketSniffer:
         Returns:
             Number of packets cleared
         """
-        count = 0
-        while not self.packet_queue.empty():
-            try:
-                self.packet_queue.get_nowait()
-                count += 1
-            except Empty:
-                break
-        return count
+        return len(self.packet_queue.drain())
     
     # ═══════════════════════════════════════════════════════════════════════════
     #                        PUBLIC API - ATTACK SIMULATION
@@ -731,7 +1359,9 @@ class PacketSniffer:
                 print("[PacketSniffer] Attacks only work in simulation mode")
             return False
         
-        attack_type = attack_type.upper()
+        # Interned, so the per-burst table lookups and the attack_type every
+        # generated packet carries share the ATTACK_TYPES key string
+        attack_type = sys.intern(attack_type.upper())
         
         if attack_type not in ATTACK_TYPES:
             if DEBUG_MODE:
@@ -742,8 +1372,9 @@ class PacketSniffer:
         
         self._attack_active = True
         self._attack_type = attack_type
-        self._attack_start_time = time.time()
-        self._attack_duration = attack_config.get("duration", 10.0)
+        self._attack_desc = attack_config
+        self._attack_start_ns = time.monotonic_ns()
+        self._attack_duration_ns = int(attack_config.get("duration", 10.0) * 1e9)
         self._current_rate = attack_config.get("intensity", ATTACK_PACKET_RATE)
         
         if DEBUG_MODE:
@@ -771,18 +1402,19 @@ class PacketSniffer:
         """Stop current attack simulation."""
         self._attack_active = False
         self._attack_type = None
+        self._attack_desc = _NO_ATTACK
         self._current_rate = NORMAL_PACKET_RATE
         
         if DEBUG_MODE:
             print("[PacketSniffer] Attack stopped")
     
-    def is_under_attack(self) -> bool:
-        """Check if an attack is currently active."""
+    def is_under_attack(self, now_ns: Optional[int] = None) -> bool:
+        """Check if an attack is currently active (pass a time.monotonic_ns() reading to reuse it)."""
         if not self._attack_active:
             return False
         
         # Check if attack duration has elapsed
-        if time.time() - self._attack_start_time >= self._attack_duration:
+        if (now_ns or time.monotonic_ns()) - self._attack_start_ns >= self._attack_duration_ns:
             self.stop_attack()
             return False
         
@@ -797,16 +1429,18 @@ class PacketSniffer:
                 "progress": 0,
             }
         
-        elapsed = time.time() - self._attack_start_time
-        progress = min(1.0, elapsed / self._attack_duration)
+        elapsed_ns = time.monotonic_ns() - self._attack_start_ns
+        duration_ns = self._attack_duration_ns
+        progress = min(1.0, elapsed_ns / duration_ns)
+        desc = self._attack_desc
         
         return {
             "active": True,
             "type": self._attack_type,
-            "name": ATTACK_TYPES.get(self._attack_type, {}).get("name", "Unknown"),
-            "description": ATTACK_TYPES.get(self._attack_type, {}).get("description", ""),
+            "name": desc.get("name", "Unknown"),
+            "description": desc.get("description", ""),
             "progress": round(progress * 100, 1),
-            "time_remaining": max(0, self._attack_duration - elapsed),
+            "time_remaining": max(0, duration_ns - elapsed_ns) / 1e9,
             "intensity": self._current_rate,
         }
     
@@ -817,35 +1451,46 @@ class PacketSniffer:
     def block_ip(self, ip: str) -> None:
         """
         Add an IP to the blocked list.
-        Future packets from this IP will be marked as blocked.
+        Future packets from this IP will be dropped (and counted as blocked).
         
         Args:
             ip: IP address to block
         """
+        ip_int = _ip_to_int(ip)
+        if ip_int < 0:
+            self._handle_error(f"Cannot block invalid IPv4 address: {ip}")
+            return
         with self._lock:
-            self._blocked_ips.add(ip)
+            blocked = _BlockSet(self._blocked_ips)
+            blocked.add(ip_int)
+            self._blocked_ips = blocked
             if DEBUG_MODE:
                 print(f"[PacketSniffer] Blocked IP: {ip}")
     
     def unblock_ip(self, ip: str) -> None:
         """Remove an IP from the blocked list."""
+        ip_int = _ip_to_int(ip)
         with self._lock:
-            self._blocked_ips.discard(ip)
+            if ip_int >= 0 and ip_int in self._blocked_ips:
+                blocked = _BlockSet(self._blocked_ips)
+                blocked.discard(ip_int)
+                self._blocked_ips = blocked
             if DEBUG_MODE:
                 print(f"[PacketSniffer] Unblocked IP: {ip}")
     
     def is_blocked(self, ip: str) -> bool:
         """Check if an IP is blocked."""
-        return ip in self._blocked_ips
+        ip_int = _ip_to_int(ip)
+        return ip_int >= 0 and ip_int in self._blocked_ips
     
     def get_blocked_ips(self) -> List[str]:
         """Get list of all blocked IPs."""
-        return list(self._blocked_ips)
+        return [_int_to_ip(ip_int) for ip_int in self._blocked_ips]
     
     def clear_blocked_ips(self) -> None:
         """Clear all blocked IPs."""
         with self._lock:
-            self._blocked_ips.clear()
+            self._blocked_ips = _BlockSet()
     
     # ═══════════════════════════════════════════════════════════════════════════
     #                          PUBLIC API - CALLBACKS
@@ -907,8 +1552,13 @@ class PacketSniffer:
         return self.statistics.get_summary()
     
     def reset_statistics(self) -> None:
-        """Reset all statistics."""
-        self.statistics.reset()
+        """
+        Reset all statistics, from any thread. Publishes a fresh
+        CaptureStatistics rather than resetting the live one, so the capture
+        thread stays its only writer (it picks the new instance up on its
+        next update; an update in flight lands in the discarded one).
+        """
+        self.statistics = CaptureStatistics()
     
     def is_running(self) -> bool:
         """Check if sniffer is running."""
@@ -954,98 +1604,128 @@ class PacketSniffer:
             self.status = SnifferStatus.ERROR
     
     def _simulation_loop(self) -> None:
-        """Main loop for simulated packet generation."""
-        while not self._stop_event.is_set():
+        """
+        Main loop for simulated packet generation.
+        Ticks are scheduled against absolute deadlines, so time spent
+        generating a burst doesn't stretch the interval and the mean rate
+        stays at _current_rate; a late tick is run straight away.
+        """
+        deadline = time.monotonic()
+        while True:
             try:
+                state = self._run_state
+                if state == _RUN_STOPPING:
+                    break
+                
                 # Check if paused
-                if self._pause_event.is_set():
-                    time.sleep(0.1)
+                if state == _RUN_PAUSED:
+                    self._stop_event.wait(0.1)
+                    deadline = time.monotonic()
                     continue
                 
-                # Check if attack completed
-                if self._attack_active:
-                    if time.time() - self._attack_start_time >= self._attack_duration:
-                        self.stop_attack()
+                # One wall-clock read per tick, shared by the packet timestamps
+                self._now = time.time()
+                
+                # Check if attack completed (monotonic, so clock changes can't end it early)
+                self.is_under_attack(time.monotonic_ns())
                 
                 # Generate packets
                 packets = self._generate_simulated_packets()
                 
                 # Process and queue packets
-                for packet in packets:
-                    self._process_packet(packet)
+                self._process_batch(packets)
                 
-                # Rate limiting - ensure we don't generate too many packets
-                # We target _current_rate packets per second
-                sleep_time = 1.0 / max(1, self._current_rate)
-                # If we generated a burst, we should sleep longer to maintain the rate
+                # Rate limiting - we target _current_rate bursts per second
+                interval = 1.0 / max(1, self._current_rate)
                 if self._attack_active:
                     # Attack bursts are handled by _generate_attack_packets
                     # but we still need some delay between bursts
-                    time.sleep(max(0.05, sleep_time))
-                else:
-                    time.sleep(sleep_time)
+                    interval = max(0.05, interval)
+                
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    # Wait on the stop event so stop() doesn't wait out the tick
+                    self._stop_event.wait(delay)
+                elif delay < -0.5:
+                    # Fell far behind (e.g. machine was suspended) - don't burst to catch up
+                    deadline = time.monotonic()
                 
             except Exception as e:
                 self._handle_error(f"Simulation loop error: {e}")
                 time.sleep(0.5)
+                deadline = time.monotonic()
 
     def _real_capture_loop(self) -> None:
-        """Main loop for real packet capture using Scapy."""
+        """Main loop for real packet capture (AF_PACKET ring, Scapy fallback)."""
         try:
-            from scapy.all import sniff, IP, TCP, UDP, ICMP
+            # Preferred path: zero-copy TPACKET_V3 ring (Linux, root)
+            if USE_RX_RING and self._ring_capture_loop():
+                return
             
-            def packet_handler(raw_packet):
-                """Handle each captured packet."""
-                try:
-                    if self._stop_event.is_set():
-                        return
-                    
-                    if self._pause_event.is_set():
-                        return
-                    
-                    if IP not in raw_packet:
-                        return
-                    
-                    # Extract packet data
-                    ip_layer = raw_packet[IP]
-                    
-                    # Determine protocol
-                    protocol = "IP"
-                    src_port = 0
-                    dst_port = 0
-                    flags = ""
-                    
-                    if TCP in raw_packet:
-                        protocol = "TCP"
-                        tcp_layer = raw_packet[TCP]
-                        src_port = tcp_layer.sport
-                        dst_port = tcp_layer.dport
-                        flags = str(tcp_layer.flags)
-                    elif UDP in raw_packet:
-                        protocol = "UDP"
-                        udp_layer = raw_packet[UDP]
-                        src_port = udp_layer.sport
-                        dst_port = udp_layer.dport
-                    elif ICMP in raw_packet:
-                        protocol = "ICMP"
-                    
-                    # Create packet object
-                    packet = Packet(
-                        src_ip=ip_layer.src,
+            if self._scapy_api is None:
+                from scapy.all import AsyncSniffer, IP, TCP, UDP, ICMP
+                self._scapy_api = (AsyncSniffer, IP, TCP, UDP, ICMP)
+            # Unpacked into locals, so to_packet reads them as closure cells
+            AsyncSniffer, IP, TCP, UDP, ICMP = self._scapy_api
+            
+            def to_packet(raw_packet) -> Optional[Packet]:
+                """Build an unclassified Packet from a captured frame (None if not IP)."""
+                # One walk down the layer chain (instead of `in` + indexing)
+                ip_layer = raw_packet.getlayer(IP)
+                if ip_layer is None:
+                    return None
+                
+                src_ip = ip_layer.src
+                src_ip_int = _ip_to_int_cached(src_ip)
+                
+                # Blocked sources are only counted, so skip dissecting
+                # their transport layer altogether
+                blocked_ips = self._blocked_ips
+                if blocked_ips and src_ip_int in blocked_ips:
+                    return Packet(
+                        src_ip=src_ip,
                         dst_ip=ip_layer.dst,
-                        src_port=src_port,
-                        dst_port=dst_port,
-                        protocol=protocol,
+                        protocol="IP",
                         size=len(raw_packet),
                         ttl=ip_layer.ttl,
-                        flags=flags,
+                        timestamp=float(raw_packet.time),
+                        classify=False,
+                        src_ip_int=src_ip_int,
                     )
-                    
-                    self._process_packet(packet)
-                    
-                except Exception as e:
-                    if DEBUG_MODE:
-                        print(f"[PacketSniffer] Error processing packet: {e}")
+                
+                # Determine protocol from the IP payload's type directly
+                protocol = "IP"
+                src_port = 0
+                dst_port = 0
+                flags = ""
+                
+                transport = ip_layer.payload
+                if isinstance(transport, TCP):
+                    protocol = "TCP"
+                    src_port = transport.sport
+                    dst_port = transport.dport
+                    flags = _TCP_FLAG_STRINGS[int(transport.flags) & 0xFF]
+                elif isinstance(transport, UDP):
+                    protocol = "UDP"
+                    src_port = transport.sport
+                    dst_port = transport.dport
+                elif isinstance(transport, ICMP):
+                    protocol = "ICMP"
+                
+                return Packet(
+                    src_ip=src_ip,
+                    dst_ip=ip_layer.dst,
+                    src_port=src_port,
+                    dst_port=dst_port,
+                    protocol=protocol,
+                    size=len(raw_packet),
+                    ttl=ip_layer.ttl,
+                    flags=flags,
+                    timestamp=float(raw_packet.time),
+                    classify=False,
+                    src_ip_int=src_ip_int,
+                )
             
             # Find working interface
             interface = self._find_working_interface() or self.interface
@@ -1053,14 +1733,49 @@ class PacketSniffer:
             if DEBUG_MODE:
                 print(f"[PacketSniffer] Starting capture on {interface}")
             
-            # Start sniffing
-            sniff(
+            # Scapy's own thread only queues raw frames (no per-packet stop
+            # check); this thread dissects and processes them in batches
+            raw_frames = deque()
+            sniffer = AsyncSniffer(
                 iface=interface,
-                prn=packet_handler,
+                filter=_capture_filter_expr(),
+                prn=raw_frames.append,
                 store=False,
-                stop_filter=lambda x: self._stop_event.is_set()
             )
+            sniffer.start()
             
+            try:
+                while self._run_state != _RUN_STOPPING:
+                    # Surface failures from Scapy's thread (e.g. no permission)
+                    error = getattr(sniffer, "exception", None)
+                    if error is not None:
+                        raise error
+                    
+                    if not raw_frames:
+                        self._stop_event.wait(0.05)
+                        continue
+                    
+                    chunk = [raw_frames.popleft() for _ in range(min(SCAPY_BATCH_SIZE, len(raw_frames)))]
+                    if self._run_state == _RUN_PAUSED:
+                        continue
+                    
+                    packets = []
+                    for raw_packet in chunk:
+                        try:
+                            packet = to_packet(raw_packet)
+                        except Exception as e:
+                            if DEBUG_MODE:
+                                print(f"[PacketSniffer] Error processing packet: {e}")
+                            continue
+                        if packet is not None:
+                            packets.append(packet)
+                    
+                    _classify_batch(packets)
+                    self._process_batch(packets)
+            finally:
+                if sniffer.running:
+                    sniffer.stop()
+        
         except PermissionError:
             self._handle_error("Permission denied. Run as administrator/root for real capture.")
             self.simulation_mode = True
@@ -1071,95 +1786,244 @@ class PacketSniffer:
             self.simulation_mode = True
             self._simulation_loop()  # Fall back to simulation
     
+    # ═══════════════════════════════════════════════════════════════════════════
+    #                        PRIVATE - AF_PACKET RING CAPTURE
+    # ═══════════════════════════════════════════════════════════════════════════
+    
+    def _open_rx_ring(self, interface: str) -> Optional[Tuple[socket.socket, mmap.mmap]]:
+        """
+        Open an AF_PACKET socket with a TPACKET_V3 receive ring mapped into memory.
+        
+        Returns:
+            (socket, mmap) tuple, or None if the ring is unavailable
+        """
+        if not hasattr(socket, "AF_PACKET"):
+            return None
+        
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+            
+            # Let the kernel discard what the game would throw away anyway
+            try:
+                hosts = _listed_sources() if CAPTURE_LISTED_SOURCES_ONLY else []
+                _attach_bpf(sock, _build_bpf_program(hosts))
+            except OSError as e:
+                if DEBUG_MODE:
+                    print(f"[PacketSniffer] Could not attach BPF filter: {e}")
+            
+            sock.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V3)
+            
+            frame_size = 2048  # Only used by the kernel for sanity checks in V3
+            req = _TPACKET_REQ3.pack(
+                RING_BLOCK_SIZE, RING_BLOCK_COUNT,
+                frame_size, (RING_BLOCK_SIZE // frame_size) * RING_BLOCK_COUNT,
+                RING_BLOCK_TIMEOUT_MS, 0, 0,
+            )
+            sock.setsockopt(SOL_PACKET, PACKET_RX_RING, req)
+            sock.bind((interface, ETH_P_ALL))
+            
+            ring = mmap.mmap(
+                sock.fileno(), RING_BLOCK_SIZE * RING_BLOCK_COUNT,
+                mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE
+            )
+            return sock, ring
+            
+        except (OSError, ValueError) as e:
+            if DEBUG_MODE:
+                print(f"[PacketSniffer] RX ring unavailable ({e}), using Scapy")
+            if sock is not None:
+                sock.close()
+            return None
+    
+    def _ring_capture_loop(self) -> bool:
+        """
+        Capture loop over the TPACKET_V3 ring.
+        Walks kernel-filled blocks in place and only builds Packet objects
+        for IPv4 frames. The kernel writes straight into the shared mapping,
+        so a whole block of packets costs at most one poll() - the same
+        batching an io_uring multishot recv would give, without the copies.
+        
+        Returns:
+            False if the ring could not be opened (caller falls back to Scapy)
+        """
+        interface = self._find_working_interface() or self.interface
+        opened = self._open_rx_ring(interface)
+        if opened is None:
+            return False
+        
+        sock, ring = opened
+        view = memoryview(ring)  # Header/field reads index the mapping without copying
+        poller = select.poll()
+        poller.register(sock, select.POLLIN | select.POLLERR)
+        
+        if DEBUG_MODE:
+            print(f"[PacketSniffer] Starting ring capture on {interface}")
+        
+        block = 0
+        try:
+            while self._run_state != _RUN_STOPPING:
+                base = block * RING_BLOCK_SIZE
+                status, num_pkts, offset = _BLOCK_HDR.unpack_from(view, base + 8)
+                
+                if not status & TP_STATUS_USER:
+                    # Block still owned by the kernel - wait (bounded so stop is noticed)
+                    poller.poll(RING_BLOCK_TIMEOUT_MS)
+                    continue
+                
+                if self._run_state == _RUN_ACTIVE:
+                    pkt_off = base + offset
+                    packets = []
+                    for _ in range(num_pkts):
+                        next_off, sec, nsec, snaplen, wire_len, _, mac, net = _PKT_HDR.unpack_from(view, pkt_off)
+                        packet = self._parse_ipv4(
+                            view, pkt_off + net, snaplen - (net - mac), wire_len, sec + nsec * 1e-9
+                        )
+                        if packet is not None:
+                            packets.append(packet)
+                        pkt_off += next_off
+                    _classify_batch(packets)
+                    self._process_batch(packets)
+                
+                # Hand the block back to the kernel
+                struct.pack_into("=I", view, base + 8, TP_STATUS_KERNEL)
+                block = (block + 1) % RING_BLOCK_COUNT
+        finally:
+            view.release()
+            ring.close()
+            sock.close()
+        
+        return True
+    
+    @staticmethod
+    def _parse_ipv4(buf, off: int, caplen: int, wire_len: int, timestamp: float) -> Optional[Packet]:
+        """Build a Packet from a raw IPv4 header (None for non-IPv4 frames)."""
+        if caplen < 20:
+            return None
+        
+        ver_ihl, ttl, proto, src, dst = _IP_HDR.unpack_from(buf, off)
+        if ver_ihl >> 4 != 4:
+            return None
+        
+        ihl = (ver_ihl & 0x0F) * 4
+        protocol = _IP_PROTOCOLS.get(proto, "IP")
+        src_port = 0
+        dst_port = 0
+        flags = ""
+        
+        if proto == 6 or proto == 17:
+            if caplen >= ihl + 4:
+                src_port, dst_port = _PORTS.unpack_from(buf, off + ihl)
+            if proto == 6 and caplen >= ihl + 14:
+                flags = _TCP_FLAG_STRINGS[buf[off + ihl + 13]]
+        
+        return Packet(
+            src_ip_int=src,
+            src_ip=_int_to_ip(src),
+            dst_ip=_int_to_ip(dst),
+            src_port=src_port,
+            dst_port=dst_port,
+            protocol=protocol,
+            size=wire_len,
+            ttl=ttl,
+            flags=flags,
+            timestamp=timestamp,  # Kernel capture time from the ring header
+            classify=False,       # Classified per block by _classify_batch
+        )
+    
     # ═══════════════════════════════════════════════════════════════════════════
     #                        PRIVATE - PACKET GENERATION
     # ═══════════════════════════════════════════════════════════════════════════
+    # Kept in pure Python: the RNG work is already bulk-drawn by _RandomPool,
+    # so what remains per packet is building the Packet itself, which a
+    # compiled (Numba/Cython) burst generator could not avoid either.
     
     def _generate_simulated_packets(self) -> List[Packet]:
         """Generate simulated packets based on current state."""
-        packets = []
-        
         if self._attack_active:
             # Generate attack packets
-            packets.extend(self._generate_attack_packets())
+            packets = self._generate_attack_packets()
             # Mix in some normal traffic
             if random.random() < 0.2:
-                packets.append(self._generate_normal_packet())
-        else:
-            # Generate normal traffic
-            count = random.randint(1, 3)
-            for _ in range(count):
-                packets.append(self._generate_normal_packet())
+                packets.extend(self._generate_normal_packets(1))
+            return packets
         
-        return packets
+        # Generate normal traffic
+        return self._generate_normal_packets(random.randint(1, 3))
     
-    def _generate_normal_packet(self) -> Packet:
-        """Generate a single normal traffic packet."""
-        # Weighted random selection: mostly safe, some unknown
-        roll = random.random()
+    def _generate_normal_packets(self, count: int) -> List[Packet]:
+        """
+        Generate a burst of normal traffic packets.
+        Every field comes pre-drawn from the random pool, then the packets
+        are built column by column.
+        """
+        (rolls, dst_ips, src_ports, dst_ports, protocols, sizes, safe_srcs, suspicious_srcs,
+         octets1, octets2, octets3, octets4) = self._normal_pool.take(count)
         
-        if roll < 0.7:
+        # Weighted random selection: mostly safe, some unknown
+        src_ips = [
             # Safe packet from whitelist
-            src_ip = random.choice(WHITELISTED_IPS)
-        elif roll < 0.9:
+            safe_src if roll < 0.7 else
             # Unknown source
-            src_ip = f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
-        else:
+            f"{o1}.{o2}.{o3}.{o4}" if roll < 0.9 else
             # Suspicious packet
-            src_ip = random.choice(SUSPICIOUS_IPS) if SUSPICIOUS_IPS else f"45.33.{random.randint(0, 255)}.{random.randint(1, 254)}"
+            suspicious_src if SUSPICIOUS_IPS else f"45.33.{o3}.{o4}"
+            for roll, safe_src, suspicious_src, o1, o2, o3, o4
+            in zip(rolls, safe_srcs, suspicious_srcs, octets1, octets2, octets3, octets4)
+        ]
+        timestamp = self._now or None
+        acquire = Packet.acquire
         
-        return Packet(
-            src_ip=src_ip,
-            dst_ip=random.choice(SERVER_IPS),
-            src_port=random.randint(49152, 65535),
-            dst_port=random.choice(SAFE_PORTS),
-            protocol=random.choice(["TCP", "UDP", "TCP", "TCP"]),  # More TCP
-            size=random.randint(64, 1500),
-        )
+        return [
+            acquire(
+                src_ip=src_ip,
+                dst_ip=dst_ip,
+                src_port=src_port,
+                dst_port=dst_port,
+                protocol=protocol,
+                size=size,
+                timestamp=timestamp,
+            )
+            for src_ip, dst_ip, src_port, dst_port, protocol, size
+            in self._unblocked_rows(src_ips, zip(src_ips, dst_ips, src_ports, dst_ports, protocols, sizes))
+        ]
     
     def _generate_attack_packets(self) -> List[Packet]:
         """Generate attack packets based on current attack type."""
-        packets = []
-        
         # We don't want to flood the queue too much in one go
         # If intensity is 200, we should only generate a few packets per call
         # because the loop runs very frequently.
         burst_size = random.randint(3, 8) # Reasonable burst for visual effect
+        attack_type = self._attack_type
+        attack_tag = _ATTACK_TAGS[attack_type]
         
-        for _ in range(burst_size):
-            # Use blacklisted IPs for attack
-            src_ip = random.choice(BLACKLISTED_IPS) if BLACKLISTED_IPS else f"185.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
-            
-            # Target our servers
-            dst_ip = random.choice(SERVER_IPS)
-            
-            # Port selection based on attack type
-            if self._attack_type == "PORT_SCAN":
-                dst_port = random.choice(ATTACK_TARGET_PORTS)
-            elif self._attack_type == "BRUTE_FORCE":
-                dst_port = 22  # SSH
-            elif self._attack_type == "SYN_FLOOD":
-                dst_port = random.choice([80, 443])
-            else:
-                dst_port = random.choice(ATTACK_TARGET_PORTS)
-            
-            packet = Packet(
+        # Blacklisted (or fallback) sources, our servers as targets
+        src_ips, dst_ips, src_ports, sizes, target_ports, web_ports = self._attack_pool.take(burst_size)
+        
+        # Ports, protocol and flags based on attack type
+        select_ports, protocol, flags = _ATTACK_SHAPES.get(attack_type, _DEFAULT_ATTACK_SHAPE)
+        dst_ports = select_ports(target_ports, web_ports, burst_size)
+        timestamp = self._now or None
+        acquire = Packet.acquire
+        
+        packets = [
+            acquire(
                 src_ip=src_ip,
                 dst_ip=dst_ip,
-                src_port=random.randint(1024, 65535),
+                src_port=src_port,
                 dst_port=dst_port,
-                protocol="ICMP" if self._attack_type == "PING_FLOOD" else "TCP",
-                size=random.randint(40, 1500),
-                flags="SYN" if self._attack_type == "SYN_FLOOD" else "",
-                attack_type=self._attack_type,
+                protocol=protocol,
+                size=size,
+                flags=flags,
+                attack_type=attack_type,
+                timestamp=timestamp,
+                classify=False,
             )
-            
-            # Force hostile classification for attack packets
-            packet.threat_level = ThreatLevel.CRITICAL if src_ip in BLACKLISTED_IPS else ThreatLevel.HOSTILE
-            packet._set_visual_properties()
-            packet.tags.append(f"attack:{self._attack_type.lower()}")
-            
-            packets.append(packet)
+            for src_ip, dst_ip, src_port, dst_port, size
+            in self._unblocked_rows(src_ips, zip(src_ips, dst_ips, src_ports, dst_ports, sizes))
+        ]
+        # Attack packets are always classified hostile
+        _classify_attack_batch(packets, attack_tag)
         
         return packets
     
@@ -1169,15 +2033,16 @@ class PacketSniffer:
     
     def _process_packet(self, packet: Packet) -> bool:
         """
-        Process a packet: check if blocked, update stats, queue it.
+        Process a packet: drop it if blocked, else update stats and queue it.
+        Blocked packets are only counted - the callback never sees them.
         
         Returns:
             True if packet was queued, False if blocked/dropped
         """
         try:
-            # Check if IP is blocked
-            if packet.src_ip in self._blocked_ips:
-                packet.mark_blocked()
+            # Early-drop gate for blocked sources
+            if not self._drop_blocked((packet,)):
+                return False
             
             # Update statistics
             self.statistics.update(packet)
@@ -1190,27 +2055,81 @@ class PacketSniffer:
                     if DEBUG_MODE:
                         print(f"[PacketSniffer] Callback error: {e}")
             
-            # Don't queue blocked packets
-            if packet.is_blocked:
-                return False
-            
-            # Add to queue
-            try:
-                self.packet_queue.put_nowait(packet)
-                return True
-            except Full:
-                # Queue full - remove oldest, add new
-                try:
-                    self.packet_queue.get_nowait()
-                    self.packet_queue.put_nowait(packet)
-                    return True
-                except:
-                    return False
+            # Add to queue (overwrites the oldest packet when full)
+            self.packet_queue.put_nowait(packet)
+            return True
                     
         except Exception as e:
             self._handle_error(f"Packet processing error: {e}")
             return False
     
+    def _drop_blocked(self, packets) -> List[Packet]:
+        """
+        Early-drop gate: return the packets whose source IP isn't on the
+        blocklist, and only count the rest (no stats/callback/queue work).
+        The whole batch is screened with one C-level membership scan first,
+        so the per-packet filter only runs when a blocked source is present.
+        """
+        blocked_ips = self._blocked_ips
+        if not blocked_ips:
+            return packets
+        ip_ints = filter(_IS_IPV4_INT, map(_SRC_IP_INT, packets))
+        # No Bloom/Xor prefilter in front of this scan: in Python its hashing
+        # costs more than the int set / bitmap probe it would be trying to avoid
+        if not any(map(blocked_ips.__contains__, ip_ints)):
+            return packets
+        
+        passed = [
+            packet for packet in packets
+            if packet.src_ip_int < 0 or packet.src_ip_int not in blocked_ips
+        ]
+        self.statistics.add_blocked(len(packets) - len(passed))
+        return passed
+    
+    def _unblocked_rows(self, src_ips: List[str], rows):
+        """
+        Screen generated rows (zipped columns) by source IP before any
+        Packet is built for them; blocked rows are only counted.
+        """
+        blocked_ips = self._blocked_ips
+        if not blocked_ips:
+            return rows
+        keep = [ip_int < 0 or ip_int not in blocked_ips for ip_int in map(_ip_to_int_cached, src_ips)]
+        if all(keep):
+            return rows
+        self.statistics.add_blocked(keep.count(False))
+        return itertools.compress(rows, keep)
+    
+    def _process_batch(self, packets: List[Packet]) -> int:
+        """
+        Batch version of _process_packet: one blocklist pass, one statistics
+        update and one ring publish for the whole batch.
+        
+        Returns:
+            Number of packets queued
+        """
+        try:
+            packets = self._drop_blocked(packets)
+            if not packets:
+                return 0
+            
+            self.statistics.update_batch(packets)
+            
+            if self._on_packet_callback:
+                for packet in packets:
+                    try:
+                        self._on_packet_callback(packet)
+                    except Exception as e:
+                        if DEBUG_MODE:
+                            print(f"[PacketSniffer] Callback error: {e}")
+            
+            self.packet_queue.put_many(packets)
+            return len(packets)
+            
+        except Exception as e:
+            self._handle_error(f"Packet batch processing error: {e}")
+            return 0
+    
     # ═══════════════════════════════════════════════════════════════════════════
     #                          PRIVATE - ERROR HANDLING
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1235,6 +2154,7 @@ class PacketSniffer:
 
 # Global sniffer instance for easy access across modules
 _global_sniffer: Optional[PacketSniffer] = None
+_global_queue: Optional[PacketRing] = None  # The global sniffer's ring, for get_packet_queue
 
 
 def get_sniffer() -> PacketSniffer:
@@ -1247,13 +2167,14 @@ def get_sniffer() -> PacketSniffer:
         sniffer = get_sniffer()
         sniffer.start()
     """
-    global _global_sniffer
+    global _global_sniffer, _global_queue
     if _global_sniffer is None:
         _global_sniffer = PacketSniffer()
+        _global_queue = _global_sniffer.packet_queue
     return _global_sniffer
 
 
-def get_packet_queue() -> Queue:
+def get_packet_queue() -> PacketRing:
     """
     Get the global packet queue.
     Convenience function for other modules.
@@ -1264,7 +2185,11 @@ def get_packet_queue() -> Queue:
         while not queue.empty():
             packet = queue.get()
     """
-    return get_sniffer().packet_queue
+    # The ring is never replaced, so after the first call this is one global read
+    queue = _global_queue
+    if queue is None:
+        queue = get_sniffer().packet_queue
+    return queue
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
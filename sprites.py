@@ -11,9 +11,38 @@ Network nodes pulse on hit/block (#25)
 import pygame
 import random
 import math
+from collections import deque
 from enum import Enum
 
 
+# Surface.fblits (pygame-ce) skips building the per-blit rect list; plain
+# pygame falls back to Surface.blits
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+# ─────────────────────────────────────────────
+#  SHARED FONTS / TEXT
+# ─────────────────────────────────────────────
+
+_FONT_CACHE = {}   # size -> Font
+_TEXT_CACHE = {}   # (text, color, size) -> rendered Surface
+
+def get_font(size):
+    """Default font at the given size, constructed once and shared."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+def render_text(text, color, size):
+    """Antialiased text surface, rendered once per (text, color, size)."""
+    key = (text, color, size)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _TEXT_CACHE[key] = get_font(size).render(text, True, color)
+    return surf
+
+
 # ─────────────────────────────────────────────
 #  PACKET TYPE (visual only)
 # ─────────────────────────────────────────────
@@ -73,12 +102,21 @@ class PacketSprite(pygame.sprite.Sprite):
     
     # Class-level cache for pre-rendered packet images
     _image_cache = {}
+    # Faded copies of those images for the block animation: key -> {alpha: Surface}
+    _fade_cache = {}
 
     def __init__(self, sx, sy, tx, ty, ptype, ip="0.0.0.0"):
         super().__init__()
+        # Normalize legacy string types ("safe", ...) so packet_type is always a PacketType
+        if isinstance(ptype, str):
+            try:
+                ptype = PacketType(ptype)
+            except ValueError:
+                ptype = PacketType.SAFE
         self.packet_type = ptype
         self.source_ip = ip
         self.visuals = PACKET_VISUALS.get(ptype, PACKET_VISUALS[PacketType.SAFE])
+        self.hostile = self.visuals['hostile']
 
         # Attack data (set by main.py)
         self.attack_id       = "SAFE"
@@ -100,13 +138,16 @@ class PacketSprite(pygame.sprite.Sprite):
         spd = (1.5 + random.random() * 0.5) * self.visuals['speed']
         self.vx = (dx / dist) * spd
         self.vy = (dy / dist) * spd
-
+        # Path length left before arrival (within 15px of target); the leg is
+        # straight, so this replaces a per-frame distance check
+        self._remaining = math.hypot(dx, dy) - 15
+        self._step = spd
+        
         # State
         self.reached_target = False
         self.is_blocked = False
         self.alpha = 255
-        self.trail = []
-        self.pulse = random.random() * 6.28
+        self.trail = deque(maxlen=4)
         self.block_rule = None
 
         # Surface setup
@@ -146,33 +187,62 @@ class PacketSprite(pygame.sprite.Sprite):
         self.threat_color = color
         self._set_image()
 
+    def _faded_image(self, alpha):
+        frames = PacketSprite._fade_cache.setdefault(self._get_cache_key(), {})
+        img = frames.get(alpha)
+        if img is None:
+            img = PacketSprite._image_cache[self._get_cache_key()].copy()
+            img.set_alpha(alpha)
+            frames[alpha] = img
+        return img
+    
     def update(self, speed_scale=1.0):
         if self.is_blocked:
+            # Fade out through the shared pre-faded frames
             self.alpha = max(0, self.alpha - 20)
-            self.image.set_alpha(self.alpha)
+            self.image = self._faded_image(self.alpha)
             return
 
         if self.reached_target:
             return
 
-        self.trail.append((int(self.x), int(self.y)))
-        if len(self.trail) > 4:
-            self.trail.pop(0)
+        self.trail.append((int(self.x), int(self.y)))  # Oldest point drops off (maxlen)
 
         self.x += self.vx * speed_scale
         self.y += self.vy * speed_scale
         self.rect.center = (int(self.x), int(self.y))
-        self.pulse += 0.15 * speed_scale
-
-        if math.hypot(self.target_x - self.x, self.target_y - self.y) < 15:
+        
+        # Per-sprite scalars rather than group-wide arrays: main.py caps live
+        # packets at ~100, far below where a vectorized step would pay off
+        self._remaining -= self._step * speed_scale
+        if self._remaining < 0:
             self.reached_target = True
+    
+    def set_course(self, tx, ty, frames):
+        """Head in a straight line for (tx, ty), arriving in `frames` frames at full speed."""
+        self.target_x = tx
+        self.target_y = ty
+        dx = tx - self.x
+        dy = ty - self.y
+        self.vx = dx / frames
+        self.vy = dy / frames
+        dist = math.hypot(dx, dy)
+        self._remaining = dist - 15
+        self._step = dist / frames
+        self.reached_target = False
 
     # Cache for trail surfaces
     _trail_cache = {}
 
     def draw_trail(self, screen):
+        pairs = self.trail_blits()
+        if pairs:
+            screen.blits(pairs, doreturn=False)
+    
+    def trail_blits(self):
+        """(surface, position) pairs for the trail dots, so callers can batch them."""
         if self.is_blocked or not self.trail:
-            return
+            return ()
             
         c = self.threat_color
         key = (c, self.visuals['size'])
@@ -184,25 +254,30 @@ class PacketSprite(pygame.sprite.Sprite):
             PacketSprite._trail_cache[key] = s
             
         trail_img = PacketSprite._trail_cache[key]
-        n = len(self.trail)
-        for i, (tx, ty) in enumerate(self.trail):
-            screen.blit(trail_img, (tx - self.visuals['size'], ty - self.visuals['size']))
+        r = self.visuals['size']
+        return [(trail_img, (tx - r, ty - r)) for tx, ty in self.trail]
 
     def block(self, rule_name=None):
         self.is_blocked = True
         self.block_rule = rule_name
-        self.image = self.image.copy()
 
     def contains_point(self, pos):
-        return math.hypot(pos[0] - self.x, pos[1] - self.y) < self.visuals['size'] + 10
-
+        r = self.visuals['size'] + 10
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        # Bounding-box reject first (most clicks miss most packets), then a
+        # squared-distance test instead of hypot
+        if dx > r or dx < -r or dy > r or dy < -r:
+            return False
+        return dx*dx + dy*dy < r*r
+    
     def get_damage(self):
         if self.threat_damage > 0:
             return self.threat_damage
         return self.visuals['damage']
 
     def is_hostile(self):
-        return self.packet_type in (PacketType.SUSPICIOUS, PacketType.MALICIOUS)
+        return self.hostile
 
 
 # ─────────────────────────────────────────────
@@ -221,6 +296,13 @@ class NetworkNode(pygame.sprite.Sprite):
         'router':      (0, 150, 255),
         'workstation': (150, 150, 200),
     }
+    
+    # Icon geometry as offsets from the node center, computed once
+    _FIREWALL_SHAPE = ((0, -16), (16, 0), (0, 16), (-16, 0))
+    _ROUTER_SPOKES = tuple(
+        (int(10*math.cos(math.radians(a))), int(10*math.sin(math.radians(a))))
+        for a in (0, 90, 180, 270)
+    )
 
     def __init__(self, x, y, ntype, name=""):
         super().__init__()
@@ -255,51 +337,63 @@ class NetworkNode(pygame.sprite.Sprite):
         """Set activity level 0.0 to 1.0"""
         self.activity = max(0.0, min(1.0, level))
 
+    # Node body per (node_type, glow alpha) - only the glow varies, over ~11 values
+    _base_cache = {}
+    
     def _render(self):
-        self.image.fill((0, 0, 0, 0))
+        glow_alpha = min(60, int(20 + 10 * self.activity))
+        key = (self.node_type, glow_alpha)
+        base = NetworkNode._base_cache.get(key)
+        if base is None:
+            base = NetworkNode._base_cache[key] = self._render_base(glow_alpha)
+        # Fresh copy: update() draws flash rings and the label on top
+        self.image = base.copy()
+    
+    def _render_base(self, glow_alpha):
+        image = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
         c = self._base_color
         sz = self.node_size
         offset = 10
         cx = sz // 2 + offset
         cy = sz // 2 + offset
-
+        
         # Ambient glow ring
-        glow_alpha = int(20 + 10 * self.activity)
         pygame.draw.circle(
-            self.image, (c[0], c[1], c[2], min(60, glow_alpha)),
+            image, (c[0], c[1], c[2], glow_alpha),
             (cx, cy), sz // 2 + 5
         )
 
         # Base circle
-        pygame.draw.circle(self.image, (c[0], c[1], c[2], 30), (cx, cy), sz // 2)
+        pygame.draw.circle(image, (c[0], c[1], c[2], 30), (cx, cy), sz // 2)
 
         if self.node_type == self.SERVER:
-            pygame.draw.rect(self.image, c, (cx-12, cy-15, 24, 30), border_radius=3)
-            pygame.draw.rect(self.image, (255,255,255,140), (cx-12, cy-15, 24, 30), 2, border_radius=3)
+            pygame.draw.rect(image, c, (cx-12, cy-15, 24, 30), border_radius=3)
+            pygame.draw.rect(image, (255,255,255,140), (cx-12, cy-15, 24, 30), 2, border_radius=3)
             for i in range(3):
-                pygame.draw.circle(self.image, (255,255,255,180), (cx, cy-8+i*8), 2)
+                pygame.draw.circle(image, (255,255,255,180), (cx, cy-8+i*8), 2)
 
         elif self.node_type == self.FIREWALL:
-            pts = [(cx, cy-16), (cx+16, cy), (cx, cy+16), (cx-16, cy)]
-            pygame.draw.polygon(self.image, c, pts)
-            pygame.draw.polygon(self.image, (255,255,255,140), pts, 2)
-            pygame.draw.circle(self.image, (255, 200, 0), (cx, cy), 4)
+            pts = [(cx + dx, cy + dy) for dx, dy in self._FIREWALL_SHAPE]
+            pygame.draw.polygon(image, c, pts)
+            pygame.draw.polygon(image, (255,255,255,140), pts, 2)
+            pygame.draw.circle(image, (255, 200, 0), (cx, cy), 4)
 
         elif self.node_type == self.ROUTER:
-            pygame.draw.circle(self.image, c, (cx, cy), 14)
-            pygame.draw.circle(self.image, (255,255,255,140), (cx, cy), 14, 2)
-            for a in [0, 90, 180, 270]:
-                r = math.radians(a)
+            pygame.draw.circle(image, c, (cx, cy), 14)
+            pygame.draw.circle(image, (255,255,255,140), (cx, cy), 14, 2)
+            for dx, dy in self._ROUTER_SPOKES:
                 pygame.draw.line(
-                    self.image, (255,255,255,180),
+                    image, (255,255,255,180),
                     (cx, cy),
-                    (cx + int(10*math.cos(r)), cy + int(10*math.sin(r))), 2
+                    (cx + dx, cy + dy), 2
                 )
 
         else:
-            pygame.draw.rect(self.image, c, (cx-10, cy-8, 20, 16), border_radius=2)
-            pygame.draw.rect(self.image, (255,255,255,140), (cx-10, cy-8, 20, 16), 1, border_radius=2)
-            pygame.draw.rect(self.image, (100,200,255,100), (cx-7, cy-5, 14, 8))
+            pygame.draw.rect(image, c, (cx-10, cy-8, 20, 16), border_radius=2)
+            pygame.draw.rect(image, (255,255,255,140), (cx-10, cy-8, 20, 16), 1, border_radius=2)
+            pygame.draw.rect(image, (100,200,255,100), (cx-7, cy-5, 14, 8))
+
+        return image
 
     def update(self):
         self.pulse += 0.05
@@ -319,60 +413,59 @@ class NetworkNode(pygame.sprite.Sprite):
         # Only re-render if something changed visually
         if old_hit != self.hit_flash or old_block != self.block_flash or old_act != int(self.activity * 10):
             self._render()
-
+            
             sz = self.node_size
             offset = 10
             cx = sz // 2 + offset
             cy = sz // 2 + offset
-
+            overlays = []
+            
             # Hit flash — red ring
             if self.hit_flash > 0:
                 flash_alpha = min(200, self.hit_flash * 12)
                 ring_radius = sz // 2 + 3 + (20 - self.hit_flash)
-                ring_surf = pygame.Surface(
-                    (ring_radius*2+4, ring_radius*2+4), pygame.SRCALPHA
-                )
-                pygame.draw.circle(
-                    ring_surf, (255, 50, 50, flash_alpha),
-                    (ring_radius+2, ring_radius+2), ring_radius, 3
-                )
-                self.image.blit(
-                    ring_surf,
+                overlays.append((
+                    self._ring((255, 50, 50, flash_alpha), ring_radius, 3),
                     (cx - ring_radius - 2, cy - ring_radius - 2)
-                )
-
+                ))
+            
             # Block flash — green ring
             if self.block_flash > 0:
                 flash_alpha = min(180, self.block_flash * 14)
                 ring_radius = sz // 2 + 2 + (15 - self.block_flash)
-                ring_surf = pygame.Surface(
-                    (ring_radius*2+4, ring_radius*2+4), pygame.SRCALPHA
-                )
-                pygame.draw.circle(
-                    ring_surf, (0, 255, 100, flash_alpha),
-                    (ring_radius+2, ring_radius+2), ring_radius, 2
-                )
-                self.image.blit(
-                    ring_surf,
+                overlays.append((
+                    self._ring((0, 255, 100, flash_alpha), ring_radius, 2),
                     (cx - ring_radius - 2, cy - ring_radius - 2)
-                )
-
+                ))
+            
             # Name label
-            try:
-                font = pygame.font.Font(None, 14)
-                name_color = (200, 200, 200)
-                if self.hit_flash > 0:
-                    name_color = (255, 100, 100)
-                elif self.block_flash > 0:
-                    name_color = (100, 255, 100)
-
-                nt = font.render(self.name, True, name_color)
-                nx = cx - nt.get_width() // 2
-                ny = cy + sz // 2 + 2
-                if ny + nt.get_height() < self.image.get_height():
-                    self.image.blit(nt, (nx, ny))
-            except Exception:
-                pass
+            name_color = (200, 200, 200)
+            if self.hit_flash > 0:
+                name_color = (255, 100, 100)
+            elif self.block_flash > 0:
+                name_color = (100, 255, 100)
+            
+            nt = render_text(self.name, name_color, 14)
+            nx = cx - nt.get_width() // 2
+            ny = cy + sz // 2 + 2
+            if ny + nt.get_height() < self.image.get_height():
+                overlays.append((nt, (nx, ny)))
+            
+            # Rings and label in one batched blit
+            self.image.blits(overlays, doreturn=False)
+    
+    # Flash rings are the same few shapes for every node: (rgba, radius, width) -> Surface
+    _ring_cache = {}
+    
+    @classmethod
+    def _ring(cls, rgba, radius, width):
+        key = (rgba, radius, width)
+        ring_surf = cls._ring_cache.get(key)
+        if ring_surf is None:
+            ring_surf = pygame.Surface((radius*2+4, radius*2+4), pygame.SRCALPHA)
+            pygame.draw.circle(ring_surf, rgba, (radius+2, radius+2), radius, width)
+            cls._ring_cache[key] = ring_surf
+        return ring_surf
 
 
 # ─────────────────────────────────────────────
@@ -388,6 +481,9 @@ class ConnectionAnimator:
     def __init__(self):
         self.connections = []  # list of (node1, node2, base_color)
         self.flashes = []     # list of {from, to, color, timer, max_timer}
+        # Pre-drawn glow textures; a flash only ever steps through a few
+        # (line, color, alpha, width) / (color, alpha, radius) combinations
+        self._glow_cache = {}
 
     def set_connections(self, conn_list):
         """conn_list: [(node1, node2, color), ...]"""
@@ -433,17 +529,19 @@ class ConnectionAnimator:
             color = f['color']
 
             # Draw thick glowing line
-            try:
-                # Main line
-                pygame.draw.line(screen, color, (n1.x, n1.y), (n2.x, n2.y), width)
-
-                # Glow effect
+            # Main line
+            pygame.draw.line(screen, color, (n1.x, n1.y), (n2.x, n2.y), width)
+
+            # Glow effect
+            ox = min(n1.x, n2.x) - 10
+            oy = min(n1.y, n2.y) - 10
+            key = (n1.x, n1.y, n2.x, n2.y, color, alpha // 3, width)
+            glow_surf = self._glow_cache.get(key)
+            if glow_surf is None:
                 glow_surf = pygame.Surface(
                     (abs(n2.x - n1.x) + 20, abs(n2.y - n1.y) + 20),
                     pygame.SRCALPHA
                 )
-                ox = min(n1.x, n2.x) - 10
-                oy = min(n1.y, n2.y) - 10
                 pygame.draw.line(
                     glow_surf,
                     (color[0], color[1], color[2], alpha // 3),
@@ -451,27 +549,27 @@ class ConnectionAnimator:
                     (n2.x - ox, n2.y - oy),
                     width + 4
                 )
-                screen.blit(glow_surf, (ox, oy))
-            except Exception:
-                pass
+                self._glow_cache[key] = glow_surf
+            screen.blit(glow_surf, (ox, oy))
 
             # Moving pulse dot along the line
-            try:
-                progress = 1.0 - t  # 0 → 1 over duration
-                px = int(n1.x + (n2.x - n1.x) * progress)
-                py = int(n1.y + (n2.y - n1.y) * progress)
-                dot_r = int(3 + 3 * t)
-                pygame.draw.circle(screen, color, (px, py), dot_r)
-                # Dot glow
+            progress = 1.0 - t  # 0 → 1 over duration
+            px = int(n1.x + (n2.x - n1.x) * progress)
+            py = int(n1.y + (n2.y - n1.y) * progress)
+            dot_r = int(3 + 3 * t)
+            pygame.draw.circle(screen, color, (px, py), dot_r)
+            # Dot glow
+            key = (color, alpha // 2, dot_r)
+            dot_glow = self._glow_cache.get(key)
+            if dot_glow is None:
                 dot_glow = pygame.Surface((dot_r*4, dot_r*4), pygame.SRCALPHA)
                 pygame.draw.circle(
                     dot_glow,
                     (color[0], color[1], color[2], alpha // 2),
                     (dot_r*2, dot_r*2), dot_r*2
                 )
-                screen.blit(dot_glow, (px - dot_r*2, py - dot_r*2))
-            except Exception:
-                pass
+                self._glow_cache[key] = dot_glow
+            screen.blit(dot_glow, (px - dot_r*2, py - dot_r*2))
 
 
 # ─────────────────────────────────────────────
@@ -526,6 +624,7 @@ class BoosterSprite(pygame.sprite.Sprite):
         self._render()
 
     def _render(self):
+        self._render_pulse = self.pulse
         self.image.fill((0, 0, 0, 0))
         cx, cy = 20, 20
         r = 15 + 2 * math.sin(self.pulse)
@@ -538,8 +637,7 @@ class BoosterSprite(pygame.sprite.Sprite):
         pygame.draw.circle(self.image, self.color, (cx, cy), r, 2)
         
         # Icon
-        font = pygame.font.Font(None, 24)
-        it = font.render(self.icon, True, self.color)
+        it = render_text(self.icon, self.color, 24)
         self.image.blit(it, (cx - it.get_width()//2, cy - it.get_height()//2))
 
     def update(self):
@@ -563,7 +661,9 @@ class BoosterSprite(pygame.sprite.Sprite):
         self.rect.center = (int(self.x), int(self.y))
 
     def draw(self, screen):
-        self._render()
+        # The image only depends on the pulse, which advances in update()
+        if self.pulse != self._render_pulse:
+            self._render()
         self.image.set_alpha(self.alpha)
         screen.blit(self.image, self.rect)
 
@@ -582,6 +682,13 @@ class IntelType(Enum):
 
 class IntelSprite(pygame.sprite.Sprite):
     """Cyber Intel collectibles (Data Chips)"""
+    
+    # Hexagon corner directions at zero rotation, computed once
+    _HEX_CORNERS = tuple(
+        (math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60)))
+        for i in range(6)
+    )
+    
     def __init__(self, x, itype=IntelType.STANDARD):
         super().__init__()
         self.itype = itype
@@ -613,18 +720,18 @@ class IntelSprite(pygame.sprite.Sprite):
         self._render()
 
     def _render(self):
+        self._render_pulse = self.pulse
         self.image.fill((0, 0, 0, 0))
         cx = self.image.get_width() // 2
         cy = self.image.get_height() // 2
         r = self.size + 2 * math.sin(self.pulse)
         
-        # Hexagon/Chip shape
-        pts = []
-        for i in range(6):
-            angle = math.radians(i * 60 + (self.pulse * 10))
-            px = cx + r * math.cos(angle)
-            py = cy + r * math.sin(angle)
-            pts.append((px, py))
+        # Hexagon/Chip shape - the corner table rotated by the pulse, so one
+        # cos/sin pair per frame instead of one per corner
+        spin = math.radians(self.pulse * 10)
+        rc = r * math.cos(spin)
+        rs = r * math.sin(spin)
+        pts = [(cx + ux * rc - uy * rs, cy + ux * rs + uy * rc) for ux, uy in self._HEX_CORNERS]
             
         # Glow
         pygame.draw.circle(self.image, (*self.glow, 40), (cx, cy), r + 5)
@@ -650,7 +757,9 @@ class IntelSprite(pygame.sprite.Sprite):
             self.kill()
 
     def draw(self, screen):
-        self._render()
+        # The image only depends on the pulse, which advances in update()
+        if self.pulse != self._render_pulse:
+            self._render()
         self.image.set_alpha(self.alpha)
         screen.blit(self.image, self.rect)
 
@@ -665,11 +774,13 @@ class IntelSprite(pygame.sprite.Sprite):
 # ─────────────────────────────────────────────
 
 class Particle:
-    __slots__ = ('x', 'y', 'color', 'dx', 'dy', 'life', 'max_life')
+    __slots__ = ('x', 'y', 'color', 'dx', 'dy', 'life', 'max_life', 'frames')
     
     # Pre-rendered cache: (color, size, alpha) -> Surface
     _cache = {}
-
+    # Whole fade sequence: (color, max_life) -> [(Surface, radius) indexed by life]
+    _fade_frames = {}
+    
     def __init__(self, x, y, color, dx, dy, life=30):
         self.x = x
         self.y = y
@@ -678,30 +789,39 @@ class Particle:
         self.dy = dy
         self.life = life
         self.max_life = life
-
-    def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        self.dx *= 0.94
-        self.dy *= 0.94
-        self.life -= 1
+        key = (color, life)
+        frames = Particle._fade_frames.get(key)
+        if frames is None:
+            frames = Particle._fade_frames[key] = Particle._build_fade(color, life)
+        self.frames = frames
+    
+    @staticmethod
+    def _build_fade(color, max_life):
+        """Surface and radius for every life value, since both depend only on life/max_life."""
+        frames = [None]
+        for life in range(1, max_life + 1):
+            # Round life/max_life to reduce cache entries
+            alpha_step = max(1, life * 5 // max_life) # 0 to 5
+            alpha = int(255 * alpha_step / 5)
+            r = max(1, int(3 * life / max_life))
+            
+            key = (color, r, alpha)
+            if key not in Particle._cache:
+                s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
+                pygame.draw.circle(s, (color[0], color[1], color[2], alpha), (r, r), r)
+                Particle._cache[key] = s
+            frames.append((Particle._cache[key], r))
+        return frames
 
     def draw(self, screen):
         if self.life <= 0:
             return
-        
-        # Round life/max_life to reduce cache entries
-        alpha_step = max(1, self.life * 5 // self.max_life) # 0 to 5
-        alpha = int(255 * alpha_step / 5)
-        r = max(1, int(3 * self.life / self.max_life))
-        
-        key = (self.color, r, alpha)
-        if key not in Particle._cache:
-            s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (self.color[0], self.color[1], self.color[2], alpha), (r, r), r)
-            Particle._cache[key] = s
-        
-        screen.blit(Particle._cache[key], (int(self.x) - r, int(self.y) - r))
+        screen.blit(*self.blit_pair())
+    
+    def blit_pair(self):
+        """(surface, position) for this particle, for batched blitting."""
+        surf, r = self.frames[self.life]
+        return surf, (int(self.x) - r, int(self.y) - r)
 
 
 # ─────────────────────────────────────────────
@@ -716,41 +836,58 @@ class ParticleSystem:
     def clear(self):
         self.particles.clear()
 
-    def emit_block_effect(self, x, y):
+    def _burst(self, x, y, count, colors, speed_min, speed_span, life_min, life_max):
+        """
+        Emit `count` particles flying out from (x, y) in random directions.
+        Colors come from one random.choices() call and the rest from plain
+        random() draws, instead of choice()/randint() per particle.
+        """
         if len(self.particles) > self.max_particles: return
-        for _ in range(12):
-            a = random.random() * 6.28
-            sp = random.random() * 4 + 1
-            c = random.choice([(255,100,0), (255,200,0), (255,50,50)])
-            self.particles.append(
-                Particle(x, y, c, math.cos(a)*sp, math.sin(a)*sp, random.randint(15, 35))
+        rnd = random.random
+        cos, sin = math.cos, math.sin
+        life_span = life_max - life_min + 1
+        self.particles.extend(
+            Particle(x, y, c, cos(a)*sp, sin(a)*sp, life_min + int(rnd() * life_span))
+            for c, a, sp in zip(
+                random.choices(colors, k=count),
+                [rnd() * 6.28 for _ in range(count)],
+                [rnd() * speed_span + speed_min for _ in range(count)],
             )
+        )
+
+    def emit_block_effect(self, x, y):
+        self._burst(x, y, 12, ((255,100,0), (255,200,0), (255,50,50)), 1, 4, 15, 35)
 
     def emit_hit_effect(self, x, y):
-        if len(self.particles) > self.max_particles: return
-        for _ in range(8):
-            a = random.random() * 6.28
-            sp = random.random() * 3 + 0.5
-            self.particles.append(
-                Particle(x, y, (255,0,0), math.cos(a)*sp, math.sin(a)*sp, random.randint(10, 25))
-            )
+        self._burst(x, y, 8, ((255,0,0),), 0.5, 3, 10, 25)
 
     def emit_success_effect(self, x, y):
         """Green particles for successful block"""
-        if len(self.particles) > self.max_particles: return
-        for _ in range(10):
-            a = random.random() * 6.28
-            sp = random.random() * 3 + 1
-            c = random.choice([(0,255,100), (0,200,80), (100,255,150)])
-            self.particles.append(
-                Particle(x, y, c, math.cos(a)*sp, math.sin(a)*sp, random.randint(12, 28))
-            )
+        self._burst(x, y, 10, ((0,255,100), (0,200,80), (100,255,150)), 1, 3, 12, 28)
 
     def update(self):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for p in self.particles:
-            p.update()
+        # Update and compact in one pass, in place: live particles slide down
+        # over dead ones and the dead tail is cut off (no new list per frame).
+        # Particles are stepped here directly, with no method call per particle.
+        particles = self.particles
+        w = 0
+        for p in particles:
+            p.x += p.dx
+            p.y += p.dy
+            p.dx *= 0.94
+            p.dy *= 0.94
+            life = p.life = p.life - 1
+            if life > 0:
+                particles[w] = p
+                w += 1
+        del particles[w:]
 
     def draw(self, screen):
-        for p in self.particles:
-            p.draw(screen)
+        # One batched blit call for all live particles
+        pairs = [p.blit_pair() for p in self.particles if p.life > 0]
+        if not pairs:
+            return
+        if _HAS_FBLITS:
+            screen.fblits(pairs)
+        else:
+            screen.blits(pairs, doreturn=False)
@@ -13,6 +13,10 @@ import pygame
 import math
 import time
 import random
+import itertools
+from collections import deque
+
+from firewall import AttackDatabase
 
 
 # ─────────────────────────────────────────────
@@ -58,6 +62,9 @@ class Theme:
     STATUS_OFF = (255, 60, 60)
 
     TIER_COLORS = {1: (0,180,255), 2: (255,180,0), 3: (180,0,255), 4: (255,60,60)}
+    
+    # Health bar color by ceil(percent): green above 60%, yellow above 30%, red below
+    HEALTH_COLOR_LUT = (NEON_RED,) * 31 + (NEON_YELLOW,) * 30 + (NEON_GREEN,) * 40
 
     @staticmethod
     def tier_color(t): return Theme.TIER_COLORS.get(t, Theme.TEXT_SECONDARY)
@@ -91,6 +98,13 @@ class MenuScreen:
         cx = width // 2
         self.btn_start = pygame.Rect(cx - bw//2, 300, bw, bh)
         self.btn_quit = pygame.Rect(cx - bw//2, 365, bw, bh)
+        
+        # Background grid as two zigzag polylines (one per direction); the
+        # joins run just outside the screen edges, so only the grid shows
+        self.grid_v = [pt for i, x in enumerate(range(0, width, 50))
+                       for pt in (((x, -1), (x, height)) if i % 2 == 0 else ((x, height), (x, -1)))]
+        self.grid_h = [pt for i, y in enumerate(range(0, height, 50))
+                       for pt in (((-1, y), (width, y)) if i % 2 == 0 else ((width, y), (-1, y)))]
 
     def handle_click(self, mpos):
         if not self.visible:
@@ -122,10 +136,8 @@ class MenuScreen:
         screen.fill((5, 8, 15))
 
         # Grid background
-        for x in range(0, self.w, 50):
-            pygame.draw.line(screen, (15, 20, 35), (x, 0), (x, self.h))
-        for y in range(0, self.h, 50):
-            pygame.draw.line(screen, (15, 20, 35), (0, y), (self.w, y))
+        pygame.draw.lines(screen, (15, 20, 35), False, self.grid_v)
+        pygame.draw.lines(screen, (15, 20, 35), False, self.grid_h)
 
         cx = self.w // 2
 
@@ -223,38 +235,71 @@ class MenuScreen:
 #  HEALTH BAR
 # ═══════════════════════════════════════════════
 
+# Low-health glow alpha for each pulse step: one pulse cycle (2π at 0.08 rad per
+# frame) is quantized to whole frames so the step index wraps exactly
+_HEALTH_PULSE_STEPS = round(2 * math.pi / 0.08)
+_HEALTH_GLOW_ALPHA = tuple(
+    int(40 + 30 * math.sin(3 * 2 * math.pi * i / _HEALTH_PULSE_STEPS))
+    for i in range(_HEALTH_PULSE_STEPS)
+)
+
+
 class HealthBar:
     def __init__(self, x, y, w, h, max_val, label="HP"):
         self.x, self.y, self.w, self.h = x, y, w, h
         self.max_val = max_val
         self.value = max_val
         self.display = float(max_val)
-        self.pulse = 0.0
+        self.pulse_step = 0 # Index into _HEALTH_GLOW_ALPHA
         self.font = pygame.font.Font(None, 16)
         self.fv = pygame.font.Font(None, 18)
+        self.label_surf = self.font.render("HEALTH", True, Theme.TEXT_SECONDARY)
+        self._shown = None # Last int(display) rendered into value_surf
+        self.value_surf = None
+        # Whole bar (label included) pre-composited; redrawn only when its key changes
+        self._bar_surf = pygame.Surface((max(w, self.label_surf.get_width()), h + 14), pygame.SRCALPHA)
+        self._bar_key = None
 
     def set_value(self, v): self.value = max(0, min(self.max_val, v))
 
     def update(self):
-        self.display += (self.value - self.display) * 0.1
-        self.pulse = (self.pulse + 0.08) % (2*math.pi)
+        if self.display != self.value:
+            self.display += (self.value - self.display) * 0.1
+            if abs(self.value - self.display) < 0.01: self.display = float(self.value)
+        self.pulse_step = (self.pulse_step + 1) % _HEALTH_PULSE_STEPS
+        shown = int(self.display)
+        if shown != self._shown:
+            # Only rasterize the percentage when the visible number changes
+            self._shown = shown
+            self.value_surf = self.fv.render(f"{shown}%", True, Theme.TEXT_BRIGHT)
 
     def draw(self, screen):
+        if self.value_surf is None: self.update()
         pct = self.display / max(1, self.max_val)
-        c = Theme.NEON_GREEN if pct > 0.6 else (Theme.NEON_YELLOW if pct > 0.3 else Theme.NEON_RED)
-        if pct <= 0.3:
-            a = max(0, min(255, int(40 + 30*math.sin(self.pulse*3))))
-            g = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-            g.fill(safe_rgba(Theme.NEON_RED, a))
-            screen.blit(g, (self.x, self.y))
-        pygame.draw.rect(screen, (20,25,35), (self.x, self.y, self.w, self.h), border_radius=4)
+        c = Theme.HEALTH_COLOR_LUT[min(100, max(0, math.ceil(pct * 100)))]
+        a = _HEALTH_GLOW_ALPHA[self.pulse_step] if pct <= 0.3 else None
         fw = max(0, int(self.w * pct))
+        key = (fw, c, a, self._shown)
+        if key != self._bar_key:
+            # Only the low-health pulse changes every frame; otherwise this
+            # runs when the bar width or the shown number moves
+            self._bar_key = key
+            self._render_bar(c, a, fw)
+        screen.blit(self._bar_surf, (self.x, self.y-14))
+    
+    def _render_bar(self, c, a, fw):
+        s = self._bar_surf
+        s.fill((0, 0, 0, 0))
+        w, h, y = self.w, self.h, 14
+        if a is not None:
+            s.fill(safe_rgba(Theme.NEON_RED, a), (0, y, w, h))
+        pygame.draw.rect(s, (20,25,35), (0, y, w, h), border_radius=4)
         if fw > 0:
-            pygame.draw.rect(screen, c, (self.x, self.y, fw, self.h), border_radius=4)
-        pygame.draw.rect(screen, c, (self.x, self.y, self.w, self.h), 2, border_radius=4)
-        screen.blit(self.font.render("HEALTH", True, Theme.TEXT_SECONDARY), (self.x, self.y-14))
-        vt = self.fv.render(f"{int(self.display)}%", True, Theme.TEXT_BRIGHT)
-        screen.blit(vt, (self.x+self.w//2-vt.get_width()//2, self.y+self.h//2-vt.get_height()//2))
+            pygame.draw.rect(s, c, (0, y, fw, h), border_radius=4)
+        pygame.draw.rect(s, c, (0, y, w, h), 2, border_radius=4)
+        s.blit(self.label_surf, (0, 0))
+        vt = self.value_surf
+        s.blit(vt, (w//2-vt.get_width()//2, y+h//2-vt.get_height()//2))
 
 
 # ═══════════════════════════════════════════════
@@ -262,14 +307,20 @@ class HealthBar:
 # ═══════════════════════════════════════════════
 
 class CyberButton:
+    # No __slots__ here or on the other widgets: each exists a handful of times,
+    # unlike the per-packet/per-particle classes that use them
     def __init__(self, x, y, w, h, text, color, callback):
         self.rect = pygame.Rect(x, y, w, h)
         self.text, self.color, self.callback = text, color, callback
         self.hovered = self.pressed = False
         self.click_anim = 0
         self.font = pygame.font.Font(None, 18)
+        self._surfs = {} # Pre-composited bodies / hover glow, keyed by what they depend on
 
     def update(self, mpos, mpressed):
+        # Rect.collidepoint beats an inlined 4-way compare on cached edges in
+        # CPython (attribute loads cost more than the C call); the group's
+        # bounds test already spares this call while the cursor is elsewhere
         self.hovered = self.rect.collidepoint(mpos)
         if self.hovered and mpressed[0]:
             self.pressed = True
@@ -280,18 +331,47 @@ class CyberButton:
         if self.click_anim > 0:
             self.click_anim -= 1
 
+    def idle(self):
+        """Cheap update for frames where the cursor is known to be elsewhere"""
+        self.hovered = self.pressed = False
+        if self.click_anim > 0:
+            self.click_anim -= 1
+
+    def _cached(self, key, make):
+        """Surface derived from text/color/size, built once per key."""
+        surf = self._surfs.get(key)
+        if surf is None:
+            surf = self._surfs[key] = make()
+        return surf
+    
+    def _make_hover_glow(self):
+        g = pygame.Surface((self.rect.w+4, self.rect.h+4), pygame.SRCALPHA)
+        g.fill(safe_rgba(self.color, 30))
+        return g
+    
+    def _make_body(self, bg, hovered, tc):
+        """Fill, hover glow, border and label composited into one surface."""
+        w, h = self.rect.size
+        s = pygame.Surface((w+4, h+4), pygame.SRCALPHA)
+        r = pygame.Rect(2, 2, w, h)
+        pygame.draw.rect(s, bg, r, border_radius=6)
+        if hovered:
+            s.blit(self._cached(("glow", self.color, self.rect.size), self._make_hover_glow), (0, 0))
+        pygame.draw.rect(s, self.color, r, 2, border_radius=6)
+        t = self.font.render(self.text, True, tc)
+        s.blit(t, (r.centerx-t.get_width()//2, r.centery-t.get_height()//2))
+        return s
+    
     def draw(self, screen):
+        # Only a handful of visual states exist, so each is rasterized once and
+        # every frame is a single blit (no per-frame rounded-rect fills)
         is_pressed_visual = self.pressed or self.click_anim > 0
         bg = Theme.PANEL_ACTIVE if is_pressed_visual else (Theme.PANEL_HOVER if self.hovered else Theme.PANEL_BG)
-        pygame.draw.rect(screen, bg, self.rect, border_radius=6)
-        if self.hovered:
-            g = pygame.Surface((self.rect.w+4, self.rect.h+4), pygame.SRCALPHA)
-            g.fill(safe_rgba(self.color, 30))
-            screen.blit(g, (self.rect.x-2, self.rect.y-2))
-        pygame.draw.rect(screen, self.color, self.rect, 2, border_radius=6)
         tc = Theme.TEXT_BRIGHT if (self.hovered or is_pressed_visual) else self.color
-        t = self.font.render(self.text, True, tc)
-        screen.blit(t, (self.rect.centerx-t.get_width()//2, self.rect.centery-t.get_height()//2))
+        hovered = self.hovered
+        key = ("body", bg, hovered, tc, self.text, self.color, self.rect.size)
+        body = self._cached(key, lambda: self._make_body(bg, hovered, tc))
+        screen.blit(body, (self.rect.x-2, self.rect.y-2))
 
 
 # ═══════════════════════════════════════════════
@@ -303,25 +383,50 @@ class StatsPanel:
         self.rect = pygame.Rect(x, y, w, h)
         self.title = title
         self.stats = {}
+        self.rows = []
         self.ft = pygame.font.Font(None, 18)
         self.fk = pygame.font.Font(None, 16)
         self.fv = pygame.font.Font(None, 17)
-
-    def set_stats(self, d): self.stats = d
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, Theme.PANEL_BG, self.rect, border_radius=5)
-        pygame.draw.rect(screen, Theme.NEON_BLUE, self.rect, 1, border_radius=5)
-        screen.blit(self.ft.render(self.title, True, Theme.NEON_BLUE), (self.rect.x+8, self.rect.y+6))
-        pygame.draw.line(screen, Theme.NEON_BLUE, (self.rect.x+5, self.rect.y+24), (self.rect.x+self.rect.w-5, self.rect.y+24))
+        self.title_surf = self.ft.render(title, True, Theme.NEON_BLUE)
+        self._key_surfs = {}   # key -> rendered key (keys never change)
+        self._value_surfs = {} # key -> (shown text, rendered value)
+        self.chrome = self._render_chrome()
+    
+    def set_stats(self, d):
+        self.stats = d
+        # Pre-render rows as (surface, pos) pairs so draw() is one blits() call
+        self.rows = []
         y = self.rect.y + 32
-        for k, v in self.stats.items():
-            screen.blit(self.fk.render(str(k), True, Theme.TEXT_SECONDARY), (self.rect.x+10, y))
-            vt = self.fv.render(str(v), True, Theme.TEXT_PRIMARY)
-            screen.blit(vt, (self.rect.x+self.rect.w-vt.get_width()-10, y))
+        for k, v in d.items():
+            # Usually only one or two values changed: re-render just those
+            kt = self._key_surfs.get(k)
+            if kt is None:
+                kt = self._key_surfs[k] = self.fk.render(str(k), True, Theme.TEXT_SECONDARY)
+            v = str(v)
+            cached = self._value_surfs.get(k)
+            if cached is not None and cached[0] == v:
+                vt = cached[1]
+            else:
+                vt = self.fv.render(v, True, Theme.TEXT_PRIMARY)
+                self._value_surfs[k] = (v, vt)
+            self.rows += ((kt, (self.rect.x+10, y)), (vt, (self.rect.x+self.rect.w-vt.get_width()-10, y)))
             y += 20
             if y > self.rect.y+self.rect.h-10: break
 
+    def _render_chrome(self):
+        """Background, border, title and divider, fixed for the panel's lifetime."""
+        w, h = self.rect.size
+        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(s, Theme.PANEL_BG, s.get_rect(), border_radius=5)
+        pygame.draw.rect(s, Theme.NEON_BLUE, s.get_rect(), 1, border_radius=5)
+        s.blit(self.title_surf, (8, 6))
+        pygame.draw.line(s, Theme.NEON_BLUE, (5, 24), (w-5, 24))
+        return s
+    
+    def draw(self, screen):
+        screen.blit(self.chrome, self.rect.topleft)
+        screen.blits(self.rows, doreturn=False)
+
 
 # ═══════════════════════════════════════════════
 #  LOG PANEL
@@ -331,10 +436,12 @@ class LogPanel:
     def __init__(self, x, y, w, h, title="LOG"):
         self.rect = pygame.Rect(x, y, w, h)
         self.title = title
-        self.logs = []
+        self.logs = deque(maxlen=100) # Oldest entries drop off on append
         self.scroll = 0
         self.ft = pygame.font.Font(None, 28) # Increased
         self.fl = pygame.font.Font(None, 20) # Increased
+        self.title_surf = self.ft.render(title, True, Theme.NEON_PURPLE)
+        self.chrome = self._render_chrome()
 
     def add_log(self, msg, typ="info"):
         cm = {"info":Theme.TEXT_SECONDARY,"success":Theme.NEON_GREEN,"warning":Theme.NEON_YELLOW,
@@ -344,56 +451,86 @@ class LogPanel:
         # Pre-render text
         surf = self.fl.render(msg, True, color)
         self.logs.append({"msg":msg,"color":color, "surf": surf})
-        if len(self.logs) > 100: self.logs = self.logs[-100:]
         vis = max(1, (self.rect.h-40)//22)
         self.scroll = max(0, len(self.logs)-vis)
 
     def clear_logs(self): self.logs.clear(); self.scroll = 0
 
+    def _render_chrome(self):
+        """Background, border, title and divider, fixed for the panel's lifetime."""
+        w, h = self.rect.size
+        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(s, Theme.PANEL_BG, s.get_rect(), border_radius=5)
+        pygame.draw.rect(s, Theme.NEON_PURPLE, s.get_rect(), 1, border_radius=5)
+        s.blit(self.title_surf, (8, 6))
+        pygame.draw.line(s, Theme.NEON_PURPLE, (5, 30), (w-5, 30))
+        return s
+    
     def draw(self, screen):
-        pygame.draw.rect(screen, Theme.PANEL_BG, self.rect, border_radius=5)
-        pygame.draw.rect(screen, Theme.NEON_PURPLE, self.rect, 1, border_radius=5)
-        screen.blit(self.ft.render(self.title, True, Theme.NEON_PURPLE), (self.rect.x+8, self.rect.y+6))
-        pygame.draw.line(screen, Theme.NEON_PURPLE, (self.rect.x+5, self.rect.y+30), (self.rect.x+self.rect.w-5, self.rect.y+30))
-        vis = max(1, (self.rect.h-45)//22)
+        r = self.rect
+        screen.blit(self.chrome, r.topleft)
+        vis = max(1, (r.h-45)//22)
         end = min(self.scroll+vis, len(self.logs))
-        y = self.rect.y+38
-        for i in range(self.scroll, end):
-            e = self.logs[i]
-            screen.blit(e["surf"], (self.rect.x+6, y))
-            y += 22
+        x, y = r.x+6, r.y+38
+        visible = itertools.islice(self.logs, self.scroll, end)
+        screen.blits([(e["surf"], (x, y + k*22)) for k, e in enumerate(visible)], doreturn=False)
 
 
 # ═══════════════════════════════════════════════
 #  THREAT INDICATOR
 # ═══════════════════════════════════════════════
 
+# High-threat glow alpha for each pulse step, quantized like the health bar's
+# (2π at 0.06 rad per frame)
+_THREAT_PULSE_STEPS = round(2 * math.pi / 0.06)
+_THREAT_GLOW_ALPHA = tuple(
+    max(0, int(20 + 25 * math.sin(3 * 2 * math.pi * i / _THREAT_PULSE_STEPS)))
+    for i in range(_THREAT_PULSE_STEPS)
+)
+
+
 class ThreatIndicator:
     def __init__(self, x, y, w, h):
         self.rect = pygame.Rect(x, y, w, h)
-        self.level = 0; self.display = 0.0; self.pulse = 0.0
+        self.level = 0; self.display = 0.0; self.pulse_step = 0 # Index into _THREAT_GLOW_ALPHA
         self.fl = pygame.font.Font(None, 14); self.fv = pygame.font.Font(None, 20)
+        self.title_surf = self.fl.render("THREAT", True, Theme.TEXT_SECONDARY)
+        self.glow_surf = pygame.Surface((w, h), pygame.SRCALPHA) # Refilled each pulse frame, never reallocated
+        self._shown = None; self._label = None
 
     def set_level(self, v): self.level = max(0, min(100, v))
     def update(self):
-        self.display += (self.level-self.display)*0.08
-        self.pulse = (self.pulse+0.06)%(2*math.pi)
+        if self.display != self.level:
+            self.display += (self.level-self.display)*0.08
+            if abs(self.level-self.display) < 0.01: self.display = float(self.level)
+        self.pulse_step = (self.pulse_step+1) % _THREAT_PULSE_STEPS
+        shown = int(self.display)
+        if shown != self._shown:
+            # Re-rasterize label/percentage only when the visible value changes
+            self._shown = shown
+            if shown >= 80: label, c = "CRITICAL", Theme.NEON_RED
+            elif shown >= 60: label, c = "HIGH", Theme.NEON_ORANGE
+            elif shown >= 35: label, c = "MEDIUM", Theme.NEON_YELLOW
+            else: label, c = "LOW", Theme.NEON_GREEN
+            if label != self._label:
+                self._label = label; self.color = c
+                self.label_surf = self.fv.render(label, True, c)
+                # High-threat glow colors for this level, indexed by pulse alpha (0-45)
+                self.glow_rgba = tuple(safe_rgba(c, a) for a in range(46))
+            self.pct_surf = self.fl.render(f"{shown}%", True, c)
 
     def draw(self, screen):
-        if self.display >= 80: label, c = "CRITICAL", Theme.NEON_RED
-        elif self.display >= 60: label, c = "HIGH", Theme.NEON_ORANGE
-        elif self.display >= 35: label, c = "MEDIUM", Theme.NEON_YELLOW
-        else: label, c = "LOW", Theme.NEON_GREEN
-        pygame.draw.rect(screen, Theme.PANEL_BG, self.rect, border_radius=6)
+        if self._shown is None: self.update()
+        c, r = self.color, self.rect
+        pygame.draw.rect(screen, Theme.PANEL_BG, r, border_radius=6)
         if self.display >= 60:
-            a = max(0, min(255, int(20+25*math.sin(self.pulse*3))))
-            g = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-            g.fill(safe_rgba(c, a)); screen.blit(g, self.rect.topleft)
-        pygame.draw.rect(screen, c, self.rect, 2, border_radius=6)
-        screen.blit(self.fl.render("THREAT", True, Theme.TEXT_SECONDARY), (self.rect.x+6, self.rect.y+4))
-        screen.blit(self.fv.render(label, True, c), (self.rect.x+6, self.rect.y+18))
-        pt = self.fl.render(f"{int(self.display)}%", True, c)
-        screen.blit(pt, (self.rect.x+self.rect.w-pt.get_width()-6, self.rect.y+20))
+            g = self.glow_surf
+            g.fill(self.glow_rgba[_THREAT_GLOW_ALPHA[self.pulse_step]]); screen.blit(g, r.topleft)
+        pygame.draw.rect(screen, c, r, 2, border_radius=6)
+        screen.blit(self.title_surf, (r.x+6, r.y+4))
+        screen.blit(self.label_surf, (r.x+6, r.y+18))
+        pt = self.pct_surf
+        screen.blit(pt, (r.x+r.w-pt.get_width()-6, r.y+20))
 
 
 # ═══════════════════════════════════════════════
@@ -405,7 +542,13 @@ class DefenseModeToggle:
         self.rect = pygame.Rect(x, y, w, h)
         self.auto = False; self.callback = callback; self.anim = 0.0
         self.font = pygame.font.Font(None, 17)
-
+        # Mode/state text per mode, rendered once: auto -> (mode_surf, state_surf)
+        self.labels = {}
+        for auto, mode, state, c in ((True, "AUTO", "ON", Theme.NEON_GREEN), (False, "MANUAL", "OFF", Theme.NEON_RED)):
+            self.labels[auto] = (self.font.render(mode, True, c), self.font.render(state, True, c))
+        # Everything but the knob, pre-composited per mode
+        self.bodies = {auto: self._render_body(auto) for auto in (True, False)}
+    
     def toggle(self):
         self.auto = not self.auto
         try: self.callback(self.auto)
@@ -424,18 +567,26 @@ class DefenseModeToggle:
     def update(self):
         self.anim = min(1.0, self.anim+0.1) if self.auto else max(0.0, self.anim-0.1)
 
+    def _render_body(self, auto):
+        w, h = self.rect.size
+        s = pygame.Surface((w, h), pygame.SRCALPHA)
+        r = s.get_rect()
+        c = Theme.NEON_GREEN if auto else Theme.NEON_RED
+        bg = (20,40,30) if auto else (40,20,20)
+        pygame.draw.rect(s, bg, r, border_radius=8)
+        pygame.draw.rect(s, c, r, 2, border_radius=8)
+        mt, st = self.labels[auto]
+        s.blit(mt, (8, 5))
+        s.blit(st, (w-st.get_width()-8, 5))
+        pygame.draw.rect(s, (40,50,60), (w-35, h-15, 30, 10), border_radius=5)
+        return s
+    
     def draw(self, screen):
-        c = Theme.NEON_GREEN if self.auto else Theme.NEON_RED
-        bg = (20,40,30) if self.auto else (40,20,20)
-        pygame.draw.rect(screen, bg, self.rect, border_radius=8)
-        pygame.draw.rect(screen, c, self.rect, 2, border_radius=8)
-        screen.blit(self.font.render("AUTO" if self.auto else "MANUAL", True, c), (self.rect.x+8, self.rect.y+5))
-        st = self.font.render("ON" if self.auto else "OFF", True, c)
-        screen.blit(st, (self.rect.x+self.rect.w-st.get_width()-8, self.rect.y+5))
-        rx = self.rect.x+self.rect.w-35; ry = self.rect.y+self.rect.h-10
-        pygame.draw.rect(screen, (40,50,60), (rx, ry-5, 30, 10), border_radius=5)
+        r = self.rect
+        screen.blit(self.bodies[self.auto], r.topleft)
+        rx = r.x+r.w-35; ry = r.y+r.h-10
         kx = int(rx+3+self.anim*14)
-        pygame.draw.circle(screen, c, (kx+5, ry), 6)
+        pygame.draw.circle(screen, Theme.NEON_GREEN if self.auto else Theme.NEON_RED, (kx+5, ry), 6)
 
 
 # ═══════════════════════════════════════════════
@@ -452,8 +603,15 @@ class ActionButtonGroup:
             CyberButton(x + bw + 10, y, bw, h, "CLEAR [C]", Theme.NEON_RED, clear_cb),
             CyberButton(x + (bw + 10) * 2, y, bw, h, "HEAL [E]", Theme.NEON_GREEN, heal_cb),
         ]
+        self.bounds = self.buttons[0].rect.unionall([b.rect for b in self.buttons[1:]])
 
-    def update(self, mpos, mclick):
+    def update(self, mpos, mclick=None):
+        if not self.bounds.collidepoint(mpos):
+            # Cursor is away from the group: skip per-button hit tests
+            for btn in self.buttons:
+                btn.idle()
+            return
+        if mclick is None: mclick = pygame.mouse.get_pressed()
         for btn in self.buttons:
             btn.update(mpos, mclick)
 
@@ -491,6 +649,12 @@ class AdaptiveThreatIndicator:
         self.active = True
         self.timer = 180 # 3 seconds
         self.alpha = 0
+        # Notice text and backdrop are fixed for the whole notice: build them once
+        self.msg_surf = self.font.render(self.msg, True, (255, 100, 0))
+        tw = self.msg_surf.get_width()
+        self.bg_rect = pygame.Rect(self.w//2 - tw//2 - 20, 150, tw + 40, 50)
+        self.bg = pygame.Surface(self.bg_rect.size, pygame.SRCALPHA)
+        self._bg_alpha = None
 
     def update(self):
         if self.timer > 0:
@@ -505,16 +669,19 @@ class AdaptiveThreatIndicator:
         if not self.active or not self.msg: return
         
         # Center of screen notice
-        t = self.font.render(self.msg, True, (255, 100, 0))
+        t = self.msg_surf
         t.set_alpha(self.alpha)
         
         # Glow effect
         p = abs(math.sin(time.time() * 8)) * 100
         glow_color = (255, 100 + int(p), 0)
         
-        bg_rect = pygame.Rect(self.w//2 - t.get_width()//2 - 20, 150, t.get_width() + 40, 50)
-        s = pygame.Surface((bg_rect.w, bg_rect.h), pygame.SRCALPHA)
-        s.fill((40, 10, 0, min(180, self.alpha)))
+        bg_rect, s = self.bg_rect, self.bg
+        bg_alpha = min(180, self.alpha)
+        if bg_alpha != self._bg_alpha:
+            # Refilled only while fading in/out
+            self._bg_alpha = bg_alpha
+            s.fill((40, 10, 0, bg_alpha))
         screen.blit(s, bg_rect.topleft)
         pygame.draw.rect(screen, (*glow_color, self.alpha), bg_rect, 2, border_radius=8)
         
@@ -535,7 +702,11 @@ class AchievementNotification:
         self.sub_font = pygame.font.Font(None, 18)
         self.color = Theme.NEON_GREEN
         self.alpha = 0
-
+        # Bar geometry and backdrop are fixed; only the backdrop's fill changes
+        self.rect = pygame.Rect(w//2 - 200, 20, 400, 35)
+        self.bg = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._bg_alpha = None
+    
     def show(self, msg, color=Theme.NEON_GREEN):
         self.msg = msg
         self.color = color
@@ -558,9 +729,11 @@ class AchievementNotification:
         if self.timer <= 0 or not self.msg: return
         
         # Overlay bar at the very top
-        rect = pygame.Rect(self.w//2 - 200, 20, 400, 35)
-        bg = pygame.Surface((400, 35), pygame.SRCALPHA)
-        bg.fill((0, 20, 10, min(200, self.alpha)))
+        rect, bg = self.rect, self.bg
+        bg_alpha = min(200, self.alpha)
+        if bg_alpha != self._bg_alpha:
+            self._bg_alpha = bg_alpha
+            bg.fill((0, 20, 10, bg_alpha))
         screen.blit(bg, rect.topleft)
         
         pygame.draw.rect(screen, (*self.color, self.alpha), rect, 2, border_radius=6)
@@ -902,7 +1075,10 @@ class SidebarRuleItem:
         self.title_font = pygame.font.Font(None, 24)
         self.desc_font = pygame.font.Font(None, 17)
         self.btn_font = pygame.font.Font(None, 17)
-
+        
+        # Description and width never change, so the height is measured once
+        self._height = None
+    
     def update_data(self, d):
         self.enabled = d.get('enabled', False)
 
@@ -919,6 +1095,8 @@ class SidebarRuleItem:
         return False
 
     def get_height(self):
+        if self._height is not None:
+            return self._height
         # Accurate height calculation based on font metrics
         words = self.description.split()
         lines = 0
@@ -932,8 +1110,9 @@ class SidebarRuleItem:
             else:
                 curr = test
         if curr: lines += 1
-        return 60 + lines * 17 + 25
-
+        self._height = 60 + lines * 17 + 25
+        return self._height
+    
     def draw(self, screen, y):
         self.rect.y = y
         self.btn_rect.y = y + 8
@@ -1090,10 +1269,16 @@ class FirewallSidebar:
         old_clip = screen.get_clip()
         screen.set_clip(clip_rect)
         
-        # Items
+        # Items - ones scrolled fully outside the clip area are only
+        # positioned (for hit tests), not drawn
         cy = self.rect.y + 85 - self.scroll
         for item in self.items:
-            h = item.draw(screen, cy)
+            h = item.get_height()
+            if cy + h <= clip_rect.top or cy >= clip_rect.bottom:
+                item.rect.y, item.rect.h = cy, h
+                item.btn_rect.y = cy + 8
+            else:
+                item.draw(screen, cy)
             cy += h + 5
         
         screen.set_clip(old_clip)
@@ -1126,6 +1311,25 @@ class ControlPanel:
         self.btn_atks = pygame.Rect(x + 20, y + 130, bw, bh)
         self.btn_rules = pygame.Rect(x + 20, y + 200, bw, bh)
         
+        # Fixed labels, rendered once (the mode label per auto_defense state)
+        self.title_surf = self.title_font.render("SYSTEM CONTROL", True, Theme.NEON_CYAN)
+        self.mode_surfs = {
+            True: self.btn_font.render("MODE: AUTO DEFENSE", True, Theme.NEON_GREEN),
+            False: self.btn_font.render("MODE: MANUAL", True, Theme.NEON_YELLOW),
+        }
+        self.atk_surf = self.btn_font.render("TYPES OF ATTACK", True, Theme.NEON_ORANGE)
+        self.rules_surf = self.btn_font.render("DEFENSE RULES", True, Theme.NEON_BLUE)
+        desc = [
+            "Manual: High Resource Usage",
+            "Auto: CPU Drain Over Time",
+            "",
+            "Configure your defenses to",
+            "protect the Main Server."
+        ]
+        dy = self.btn_rules.bottom + 30
+        self.desc_blits = [(self.desc_font.render(line, True, Theme.TEXT_SECONDARY), (x + 20, dy + i * 18))
+                           for i, line in enumerate(desc)]
+        
     def handle_click(self, mpos):
         if self.btn_auto.collidepoint(mpos):
             self.auto_defense = not self.auto_defense
@@ -1145,7 +1349,7 @@ class ControlPanel:
         pygame.draw.rect(screen, Theme.NEON_BLUE, self.rect, 2, border_radius=10)
         
         # Title
-        tt = self.title_font.render("SYSTEM CONTROL", True, Theme.NEON_CYAN)
+        tt = self.title_surf
         screen.blit(tt, (self.rect.centerx - tt.get_width()//2, self.rect.y + 15))
         
         # Auto/Manual Button
@@ -1154,37 +1358,25 @@ class ControlPanel:
         a_color = Theme.NEON_GREEN if self.auto_defense else Theme.NEON_YELLOW
         pygame.draw.rect(screen, (20, 30, 40) if a_hover else (10, 15, 25), self.btn_auto, border_radius=5)
         pygame.draw.rect(screen, a_color, self.btn_auto, 2, border_radius=5)
-        mode_text = "MODE: AUTO DEFENSE" if self.auto_defense else "MODE: MANUAL"
-        at = self.btn_font.render(mode_text, True, a_color)
+        at = self.mode_surfs[bool(self.auto_defense)]
         screen.blit(at, (self.btn_auto.centerx - at.get_width()//2, self.btn_auto.centery - at.get_height()//2))
         
         # Type of Attack Button
         at_hover = self.btn_atks.collidepoint(mpos)
         pygame.draw.rect(screen, (20, 30, 40) if at_hover else (10, 15, 25), self.btn_atks, border_radius=5)
         pygame.draw.rect(screen, Theme.NEON_ORANGE, self.btn_atks, 2, border_radius=5)
-        atk_t = self.btn_font.render("TYPES OF ATTACK", True, Theme.NEON_ORANGE)
+        atk_t = self.atk_surf
         screen.blit(atk_t, (self.btn_atks.centerx - atk_t.get_width()//2, self.btn_atks.centery - atk_t.get_height()//2))
         
         # Rules Button
         r_hover = self.btn_rules.collidepoint(mpos)
         pygame.draw.rect(screen, (20, 30, 40) if r_hover else (10, 15, 25), self.btn_rules, border_radius=5)
         pygame.draw.rect(screen, Theme.NEON_BLUE, self.btn_rules, 2, border_radius=5)
-        rules_t = self.btn_font.render("DEFENSE RULES", True, Theme.NEON_BLUE)
+        rules_t = self.rules_surf
         screen.blit(rules_t, (self.btn_rules.centerx - rules_t.get_width()//2, self.btn_rules.centery - rules_t.get_height()//2))
 
         # Description text
-        desc = [
-            "Manual: High Resource Usage",
-            "Auto: CPU Drain Over Time",
-            "",
-            "Configure your defenses to",
-            "protect the Main Server."
-        ]
-        y = self.btn_rules.bottom + 30
-        for line in desc:
-            lt = self.desc_font.render(line, True, Theme.TEXT_SECONDARY)
-            screen.blit(lt, (self.rect.x + 20, y))
-            y += 18
+        screen.blits(self.desc_blits, doreturn=False)
 
 
 # ═══════════════════════════════════════════════
@@ -1253,11 +1445,17 @@ class LiveTerminalFeed:
 
     def __init__(self, x, y, w, h):
         self.rect = pygame.Rect(x, y, w, h)
-        self.lines = []
+        self.title_rect = pygame.Rect(x, y, w, 30)
         self.max_lines = 60
+        self.lines = deque(maxlen=self.max_lines) # Oldest entries drop off on append
         self.scroll = 0
         self.font = pygame.font.Font(None, 20) # Smaller font
         self.title_font = pygame.font.Font(None, 22) # Smaller font
+        # Fixed title and the two blinking prompt glyphs, rendered once
+        self.title_font.set_bold(True)
+        self.title_surf = self.title_font.render("NETWORK MONITOR", True, (0, 200, 100))
+        self.title_font.set_bold(False)
+        self.prompt_surfs = [self.font.render(dot, True, (0, 255, 100)) for dot in (">", "_")]
 
     def add_entry(self, text, severity="info"):
         colors = {
@@ -1271,8 +1469,6 @@ class LiveTerminalFeed:
         # Pre-render text
         surf = self.font.render(text, True, color)
         self.lines.append({"text": text, "color": color, "surf": surf})
-        if len(self.lines) > self.max_lines:
-            self.lines = self.lines[-self.max_lines:]
         vis = self._vis()
         self.scroll = max(0, len(self.lines) - vis)
 
@@ -1289,23 +1485,19 @@ class LiveTerminalFeed:
         pygame.draw.rect(screen, (0, 100, 60), self.rect, 1, border_radius=4)
 
         # Title bar
-        pygame.draw.rect(screen, (0, 40, 25), (self.rect.x, self.rect.y, self.rect.w, 30), border_radius=4)
-        self.title_font.set_bold(True)
-        tt = self.title_font.render("NETWORK MONITOR", True, (0, 200, 100))
-        screen.blit(tt, (self.rect.x + 8, self.rect.y + 4))
-        self.title_font.set_bold(False)
-
+        pygame.draw.rect(screen, (0, 40, 25), self.title_rect, border_radius=4)
+        screen.blit(self.title_surf, (self.rect.x + 8, self.rect.y + 4))
+        
         # Scrolling prompt
-        dot = ">" if int(time.time() * 2) % 2 == 0 else "_"
-        dt = self.font.render(dot, True, (0, 255, 100))
+        dt = self.prompt_surfs[int(time.time() * 2) % 2]
         screen.blit(dt, (self.rect.x + self.rect.w - 18, self.rect.y + 6))
-
-        # Lines
+        
+        # Lines - the visible window is read straight out of the deque (no
+        # slice copy or reversed list per frame)
         vis = self._vis()
         end = min(self.scroll + vis, len(self.lines))
         y = self.rect.y + 35
-        for i in range(self.scroll, end):
-            entry = self.lines[i]
+        for entry in itertools.islice(self.lines, self.scroll, end):
             screen.blit(entry["surf"], (self.rect.x + 8, y))
             y += 22
 
@@ -1332,6 +1524,10 @@ class SmartSuggestionBar:
         if tip and tip != self.tip:
             self.tip = tip
             self.timer = 240  # 4 seconds at 60fps
+            # Text and its backing box are built once per tip, not per frame
+            self.tip_surf = self.font.render(tip, True, Theme.NEON_YELLOW)
+            self.bg = pygame.Surface((self.tip_surf.get_width() + 16, self.tip_surf.get_height() + 10), pygame.SRCALPHA)
+            self._bg_alpha = None
 
     def update(self):
         if self.timer > 0:
@@ -1344,16 +1540,17 @@ class SmartSuggestionBar:
             return
 
         alpha = min(255, self.timer * 4)
-        t = self.font.render(self.tip, True, Theme.NEON_YELLOW)
-        tw = t.get_width() + 16
-        th = t.get_height() + 10
+        t, bg = self.tip_surf, self.bg
+        tw, th = bg.get_size()
 
         bx = self.x - tw // 2
         by = self.y - 40
 
-        # Background
-        bg = pygame.Surface((tw, th), pygame.SRCALPHA)
-        bg.fill(safe_rgba((20, 30, 15), min(200, alpha)))
+        # Background (refilled only while the fade-out changes its alpha)
+        bg_alpha = min(200, alpha)
+        if bg_alpha != self._bg_alpha:
+            self._bg_alpha = bg_alpha
+            bg.fill(safe_rgba((20, 30, 15), bg_alpha))
         screen.blit(bg, (bx, by))
 
         # Border
@@ -1397,6 +1594,25 @@ class MissionBriefing:
         self.wave_data = wave_data
         self.visible = True
         self.timer = 0
+        self.attack_rows = self._render_attack_rows(wave_data.get('attacks', []))
+    
+    def _render_attack_rows(self, attacks):
+        """Attack lines for the briefing, looked up and rendered once per wave."""
+        rows = []
+        try:
+            for aid in attacks:
+                info = AttackDatabase.get(aid)
+                if info:
+                    name = info.get('name', aid)
+                    sev = info.get('severity', '?')
+                    dmg = info.get('damage', 0)
+                    sc = Theme.severity_color(sev)
+                    
+                    row = f"  {name}  |  {sev}  |  {dmg} DMG"
+                    rows.append(self.body_font.render(row, True, sc))
+        except (KeyError, AttributeError):
+            rows = [self.body_font.render(f"  {aid}", True, Theme.NEON_RED) for aid in attacks]
+        return rows
 
     def handle_click(self, mpos):
         if not self.visible:
@@ -1448,26 +1664,9 @@ class MissionBriefing:
         screen.blit(at, (cx - at.get_width()//2, y))
         y += 35
 
-        attacks = w.get('attacks', [])
-        try:
-            from firewall import AttackDatabase
-            for aid in attacks:
-                info = AttackDatabase.get(aid)
-                if info:
-                    name = info.get('name', aid)
-                    sev = info.get('severity', '?')
-                    dmg = info.get('damage', 0)
-                    sc = Theme.severity_color(sev)
-
-                    row = f"  {name}  |  {sev}  |  {dmg} DMG"
-                    rt = self.body_font.render(row, True, sc)
-                    screen.blit(rt, (cx - rt.get_width()//2, y))
-                    y += 28
-        except:
-            for aid in attacks:
-                rt = self.body_font.render(f"  {aid}", True, Theme.NEON_RED)
-                screen.blit(rt, (cx - rt.get_width()//2, y))
-                y += 28
+        for rt in self.attack_rows:
+            screen.blit(rt, (cx - rt.get_width()//2, y))
+            y += 28
 
         # Strategy/Hint with word-wrap
         y += 30
@@ -1768,13 +1967,12 @@ class AttackEncyclopedia:
 
     def _load_attacks(self):
         try:
-            from firewall import AttackDatabase
             self.attacks = []
             for aid in AttackDatabase.all_ids():
                 info = AttackDatabase.get(aid)
                 if info:
                     self.attacks.append({"id": aid, **info})
-        except: pass
+        except (KeyError, AttributeError): pass
 
     def toggle(self):
         self.visible = not self.visible
@@ -2237,7 +2435,11 @@ class AttackPopup:
         self.ft = pygame.font.Font(None, 18)
         self.fb = pygame.font.Font(None, 15)
         self.fs = pygame.font.Font(None, 16)
-
+        self._info_id = None  # attack_id that _info was looked up for
+        self._info = None
+        self._text_key = None # (attack_id, source_ip) that _text was rendered for
+        self._text = ()       # Static (surface, line advance) rows of the popup
+    
     def show(self, aid, ip, mx, my):
         self.visible = True; self.attack_id = aid; self.source_ip = ip
         self.px = mx + 15; self.py = my - 10
@@ -2246,10 +2448,13 @@ class AttackPopup:
 
     def draw(self, screen):
         if not self.visible or not self.attack_id: return
-        try:
-            from firewall import AttackDatabase
-            info = AttackDatabase.get(self.attack_id)
-        except: return
+        if self.attack_id != self._info_id:
+            # Looked up once per hovered attack, not every frame
+            self._info_id = self.attack_id
+            try:
+                self._info = AttackDatabase.get(self.attack_id)
+            except (KeyError, AttributeError): self._info = None
+        info = self._info
         if not info: return
 
         sw, sh = screen.get_size()
@@ -2262,17 +2467,14 @@ class AttackPopup:
         pygame.draw.rect(screen, sc, rect, 2, border_radius=6)
         pygame.draw.rect(screen, sc, (self.px, self.py, 4, self.H), border_radius=2)
 
+        key = (self.attack_id, self.source_ip)
+        if key != self._text_key:
+            # Header and wrapped explanation only change with the hovered packet
+            self._text_key = key
+            self._text = self._render_text(info, sc)
         y = self.py + 8
-        screen.blit(self.ft.render(f"! {info.get('name','?')} [{info.get('severity','?')}]", True, sc), (self.px+10, y)); y += 18
-        if self.source_ip:
-            screen.blit(self.fb.render(f"From: {self.source_ip}", True, Theme.TEXT_SECONDARY), (self.px+10, y)); y += 14
-        screen.blit(self.fb.render(f"Damage: {info.get('damage',0)} HP", True, Theme.NEON_RED), (self.px+10, y)); y += 16
-
-        exp = info.get("explanation", "")
-        lc = 48
-        lines = [exp[i:i+lc] for i in range(0, len(exp), lc)]
-        for line in lines[:4]:
-            screen.blit(self.fb.render(line, True, Theme.TEXT_PRIMARY), (self.px+10, y)); y += 13
+        for surf, dy in self._text:
+            screen.blit(surf, (self.px+10, y)); y += dy
         y += 4
 
         counters = info.get("countered_by", [])
@@ -2284,6 +2486,19 @@ class AttackPopup:
                 else:
                     screen.blit(self.fs.render(f"X {rule.name}: OFF", True, Theme.NEON_RED), (self.px+10, y))
                 y += 16
+    
+    def _render_text(self, info, sc):
+        rows = [(self.ft.render(f"! {info.get('name','?')} [{info.get('severity','?')}]", True, sc), 18)]
+        if self.source_ip:
+            rows.append((self.fb.render(f"From: {self.source_ip}", True, Theme.TEXT_SECONDARY), 14))
+        rows.append((self.fb.render(f"Damage: {info.get('damage',0)} HP", True, Theme.NEON_RED), 16))
+        
+        exp = info.get("explanation", "")
+        lc = 48
+        lines = [exp[i:i+lc] for i in range(0, len(exp), lc)]
+        for line in lines[:4]:
+            rows.append((self.fb.render(line, True, Theme.TEXT_PRIMARY), 13))
+        return rows
 
 
 # ═══════════════════════════════════════════════
@@ -2300,12 +2515,10 @@ class DefenseBar:
         self.fs = pygame.font.Font(None, 13)
 
     def update(self, defense, mpos):
-        try:
-            s = defense.get_stats()
-            self.active = s.get('active_rules', 0)
-            self.total = s.get('total_rules', 0)
-            self.coverage = defense.get_defense_score()
-        except: pass
+        s = defense.get_stats()
+        self.active = s.get('active_rules', 0)
+        self.total = s.get('total_rules', 0)
+        self.coverage = defense.get_defense_score()
         self.hovered = self.rect.collidepoint(mpos)
 
     def handle_click(self, mpos):
@@ -9,6 +9,7 @@ import pygame
 import random
 import math
 import time
+from collections import deque
 
 print("[UNIQUE] Loading unique features...")
 
@@ -17,15 +18,32 @@ print("[UNIQUE] Loading unique features...")
 # NETWORK HEARTBEAT MONITOR
 # ============================================
 
+def _ecg_point(phase):
+    """Height (0-1) of the ECG trace at a phase in [0, 2π)."""
+    if phase < 0.5:
+        return 0.5
+    elif phase < 0.7:
+        return 0.5 + (phase - 0.5) * 2
+    elif phase < 0.9:
+        return 0.9 - (phase - 0.7) * 4
+    elif phase < 1.1:
+        return 0.1 + (phase - 0.9) * 2
+    return 0.5
+
+# One period of the ECG trace, quantized to the 0.15 rad advanced per update
+_ECG_STEPS = round(2 * math.pi / 0.15)
+_ECG_WAVE = tuple(_ecg_point(2 * math.pi * i / _ECG_STEPS) for i in range(_ECG_STEPS))
+
+
 class NetworkHeartbeat:
     """ECG-style heartbeat monitor for network health."""
     
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         
-        self.heartbeat_data = []
         self.max_points = 100
-        self.pulse_phase = 0
+        self.heartbeat_data = deque(maxlen=self.max_points) # Oldest points drop off on append
+        self.pulse_step = 0 # Index into _ECG_WAVE
         self.is_flatlining = False
         self.bpm = 60
         self.last_health = 100
@@ -33,12 +51,22 @@ class NetworkHeartbeat:
         self.beep_timer = 0
         self.show_beep = False
         
+        self.graph_rect = pygame.Rect(x + 5, y + 18, width - 10, height - 23)
+        self.graph_xs = () # Trace x positions for the current number of points
+        
+        self.font = pygame.font.Font(None, 16)
+        self.warning_font = pygame.font.Font(None, 20)
+        self.label_surfs = {} # (text, color) -> Surface; the BPM only changes with the health bracket
+        self.chromes = {}     # (border color, grid shown) -> pre-composited background
+        self.warning_surf = self.warning_font.render("!! FLATLINE !!", True, (255, 0, 0))
+        self.warning_rect = self.warning_surf.get_rect(center=self.rect.center)
+        
         print("[HEART] ✅ Network Heartbeat initialized")
     
     def update(self, health: float):
         """Update heartbeat based on health."""
         self.last_health = health
-        self.pulse_phase += 0.15
+        self.pulse_step = (self.pulse_step + 1) % _ECG_STEPS
         
         if health > 70:
             self.bpm = 60
@@ -54,27 +82,11 @@ class NetworkHeartbeat:
         if self.is_flatlining:
             point = 0.5
         else:
-            phase = self.pulse_phase % (2 * math.pi)
-            
-            if phase < 0.5:
-                point = 0.5
-            elif phase < 0.7:
-                point = 0.5 + (phase - 0.5) * 2
-            elif phase < 0.9:
-                point = 0.9 - (phase - 0.7) * 4
-            elif phase < 1.1:
-                point = 0.1 + (phase - 0.9) * 2
-            else:
-                point = 0.5
-            
             noise = (100 - health) / 500
-            point += random.uniform(-noise, noise)
+            point = _ECG_WAVE[self.pulse_step] + random.uniform(-noise, noise)
         
         self.heartbeat_data.append(point)
         
-        if len(self.heartbeat_data) > self.max_points:
-            self.heartbeat_data.pop(0)
-        
         self.beep_timer += 1
         beep_interval = max(10, 60 - self.bpm // 3)
         if self.beep_timer >= beep_interval:
@@ -83,9 +95,34 @@ class NetworkHeartbeat:
         else:
             self.show_beep = False
     
+    def _label(self, text, color):
+        """Rendered label, cached per (text, color)."""
+        surf = self.label_surfs.get((text, color))
+        if surf is None:
+            surf = self.label_surfs[(text, color)] = self.font.render(text, True, color)
+        return surf
+    
+    def _chrome(self, border_color, grid):
+        """Background, border, title and (once there is a trace) grid, cached per state."""
+        chrome = self.chromes.get((border_color, grid))
+        if chrome is None:
+            chrome = self.chromes[(border_color, grid)] = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            r = chrome.get_rect()
+            pygame.draw.rect(chrome, (5, 15, 10), r, border_radius=5)
+            pygame.draw.rect(chrome, border_color, r, 2, border_radius=5)
+            chrome.blit(self.font.render("NETWORK PULSE", True, border_color), (5, 3))
+            if grid:
+                g = self.graph_rect.move(-self.rect.x, -self.rect.y)
+                for i in range(4):
+                    y = g.y + i * g.height // 3
+                    pygame.draw.line(chrome, (20, 40, 30), (g.x, y), (g.right, y), 1)
+        return chrome
+    
     def draw(self, surface):
         """Draw the heartbeat monitor."""
-        pygame.draw.rect(surface, (5, 15, 10), self.rect, border_radius=5)
+        rect = self.rect
+        if not surface.get_clip().colliderect(rect):
+            return # Scrolled out / hidden - nothing would show
         
         if self.is_flatlining:
             border_color = (255, 0, 0)
@@ -94,48 +131,34 @@ class NetworkHeartbeat:
         else:
             border_color = (0, 255, 100)
         
-        pygame.draw.rect(surface, border_color, self.rect, 2, border_radius=5)
-        
-        font = pygame.font.Font(None, 16)
-        title = font.render("NETWORK PULSE", True, border_color)
-        surface.blit(title, (self.rect.x + 5, self.rect.y + 3))
-        
-        bpm_text = font.render(f"{self.bpm} BPM", True, border_color)
-        surface.blit(bpm_text, (self.rect.right - 55, self.rect.y + 3))
+        data = self.heartbeat_data
+        surface.blit(self._chrome(border_color, len(data) > 1), rect.topleft)
+        surface.blit(self._label(f"{self.bpm} BPM", border_color), (rect.right - 55, rect.y + 3))
         
         if self.show_beep and not self.is_flatlining:
-            pygame.draw.circle(surface, border_color, (self.rect.right - 70, self.rect.y + 10), 4)
-        
-        if len(self.heartbeat_data) > 1:
-            graph_rect = pygame.Rect(
-                self.rect.x + 5,
-                self.rect.y + 18,
-                self.rect.width - 10,
-                self.rect.height - 23
-            )
+            pygame.draw.circle(surface, border_color, (rect.right - 70, rect.y + 10), 4)
+        
+        if len(data) > 1:
+            graph_rect = self.graph_rect
             
-            for i in range(4):
-                y = graph_rect.y + i * graph_rect.height // 3
-                pygame.draw.line(surface, (20, 40, 30), (graph_rect.x, y), (graph_rect.right, y), 1)
+            # x positions only depend on the point count, which stays at
+            # max_points once the trace has filled up
+            n = len(data)
+            if len(self.graph_xs) != n:
+                self.graph_xs = tuple(graph_rect.x + (i * graph_rect.width // n) for i in range(n))
             
-            points = []
-            for i, value in enumerate(self.heartbeat_data):
-                x = graph_rect.x + (i * graph_rect.width // len(self.heartbeat_data))
-                y = graph_rect.bottom - int(value * graph_rect.height)
-                y = max(graph_rect.y, min(graph_rect.bottom, y))
-                points.append((x, y))
+            top, bottom, height = graph_rect.y, graph_rect.bottom, graph_rect.height
+            points = list(zip(self.graph_xs, [
+                max(top, min(bottom, bottom - int(value * height)))
+                for value in data
+            ]))
             
-            if len(points) > 1:
-                pygame.draw.lines(surface, border_color, False, points, 2)
-                
-                if points:
-                    pygame.draw.circle(surface, border_color, points[-1], 4)
+            # One point per sample, so there are always at least two here
+            pygame.draw.lines(surface, border_color, False, points, 2)
+            pygame.draw.circle(surface, border_color, points[-1], 4)
         
         if self.is_flatlining:
-            warning_font = pygame.font.Font(None, 20)
-            warning = warning_font.render("!! FLATLINE !!", True, (255, 0, 0))
-            warning_rect = warning.get_rect(center=(self.rect.centerx, self.rect.centery))
-            surface.blit(warning, warning_rect)
+            surface.blit(self.warning_surf, self.warning_rect)
 
 
 # ============================================
@@ -163,44 +186,54 @@ class CyberNewsTicker:
         
         self.scroll_x = self.rect.width
         self.scroll_speed = 1.5
-        self.current_news = random.choice(self.news_items)
-        self.text_width = 0
+        
+        self.font = pygame.font.Font(None, 18)
+        
+        # Background, border and "NEWS" label in one surface
+        self.chrome = pygame.Surface(self.rect.size)
+        self.chrome.fill((20, 10, 30))
+        pygame.draw.rect(self.chrome, (100, 50, 150), self.chrome.get_rect(), 1)
+        self.chrome.blit(self.font.render("NEWS", True, (150, 100, 200)), (5, 4))
+        self.text_clip = pygame.Rect(self.rect.x + 50, self.rect.y, self.rect.width - 55, self.rect.height)
+        self._set_news(random.choice(self.news_items))
         
         print("[NEWS] ✅ Cyber News Ticker initialized")
     
+    def _set_news(self, news: str):
+        """Show a new headline, rendering it once for the whole scroll."""
+        self.current_news = news
+        self.news_surf = self.font.render(news, True, (220, 220, 255))
+        self.text_width = self.news_surf.get_width()
+    
     def update(self):
         """Update scroll position."""
         self.scroll_x -= self.scroll_speed
         
         if self.scroll_x < -self.text_width - 50:
             self.scroll_x = self.rect.width
-            self.current_news = random.choice(self.news_items)
+            self._set_news(random.choice(self.news_items))
     
     def add_breaking_news(self, news: str):
         """Add breaking news item."""
-        self.current_news = f"🔴 BREAKING: {news}"
+        self._set_news(f"🔴 BREAKING: {news}")
         self.scroll_x = self.rect.width
     
     def draw(self, surface):
         """Draw the news ticker."""
-        pygame.draw.rect(surface, (20, 10, 30), self.rect)
-        pygame.draw.rect(surface, (100, 50, 150), self.rect, 1)
-        
-        font_icon = pygame.font.Font(None, 18)
-        icon = font_icon.render("NEWS", True, (150, 100, 200))
-        surface.blit(icon, (self.rect.x + 5, self.rect.y + 4))
+        old_clip = surface.get_clip()
+        if not old_clip.colliderect(self.rect):
+            return # Scrolled out / hidden - nothing would show
         
-        font = pygame.font.Font(None, 18)
-        text = font.render(self.current_news, True, (220, 220, 255))
-        self.text_width = text.get_width()
+        surface.blit(self.chrome, self.rect.topleft)
         
-        clip_rect = pygame.Rect(self.rect.x + 50, self.rect.y, self.rect.width - 55, self.rect.height)
+        text = self.news_surf
+        clip_rect = self.text_clip
         
         text_x = self.rect.x + 50 + int(self.scroll_x)
         if text_x < self.rect.right and text_x + self.text_width > self.rect.x + 50:
-            surface.set_clip(clip_rect)
+            surface.set_clip(clip_rect.clip(old_clip))
             surface.blit(text, (text_x, self.rect.y + 4))
-            surface.set_clip(None)
+            surface.set_clip(old_clip)
 
 
 # ============================================
@@ -209,6 +242,7 @@ class CyberNewsTicker:
 
 if __name__ == "__main__":
     print("\nTesting Unique Features...")
+    pygame.init() # Widgets create their fonts up front
     
     print("\n[TEST] Network Heartbeat")
     heart = NetworkHeartbeat(0, 0, 200, 80)